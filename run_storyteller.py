@@ -8,10 +8,13 @@ import os
 import sys
 import time
 import argparse
+import atexit
+import queue
 import logging.config
+import logging.handlers
 from dotenv import load_dotenv
 from storyteller_lib.storyteller import generate_story
-from storyteller_lib import set_progress_callback, reset_progress_tracking
+from storyteller_lib import set_progress_callback, reset_progress_tracking, flush_progress
 from storyteller_lib.config import DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES
 from storyteller_lib.story_info import save_story_info
 
@@ -25,6 +28,19 @@ else:
     # Fallback if config file not found - at least silence httpx
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
+# Hand log records to a background listener thread so that emitting errors
+# never blocks the story generation pipeline on stderr writes
+log_queue = queue.SimpleQueue()
+root_logger = logging.getLogger()
+if not root_logger.handlers:
+    # Without a config file the root logger has no handlers; swapping in the
+    # QueueHandler would also disable logging.lastResort, so write to stderr
+    root_logger.addHandler(logging.StreamHandler())
+log_listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+log_listener.start()
+atexit.register(log_listener.stop)
+
 # Progress tracking variables
 start_time = None
 node_counts = {}
@@ -681,11 +697,16 @@ def main():
                 return_state=True  # Return both story text and state
             )
             
+            # Let any queued progress updates print before the completion message
+            flush_progress()
+            
             # Show completion message
             elapsed = time.time() - start_time
             elapsed_str = f"{elapsed:.1f}s"
             print(f"[{elapsed_str}] Story generation complete!")
         except Exception as e:
+            flush_progress()
+            
             # Show error message with elapsed time
             elapsed = time.time() - start_time
             elapsed_str = f"{elapsed:.1f}s"
@@ -2,82 +2,335 @@
 StoryCraft Agent Package - A multi-component story generation system using LangGraph.
 """
 
+from __future__ import annotations
+
 import functools
+import logging
+import os
+import queue
+import sys
+import threading
 import time
-import inspect
-from typing import Dict, Any, Callable, Optional
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class ProgressTracker:
+    """
+    Shared progress tracking state for all decorated node functions.
+    
+    Slotted so the per-node hot path reads its fields at fixed offsets instead of
+    through an instance dictionary.
+    """
+    callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    start_time_ns: Optional[int] = None
+    # Nanoseconds since tracking started, as of the node whose event is being reported
+    elapsed_ns: int = 0
+    # Node invocations are only counted while a callback is registered.
+    # Per-node single-item lists holding the count, updated under _count_lock;
+    # decorated nodes keep a direct reference to their slot
+    counts: Dict[str, List[int]] = field(default_factory=dict)
+    # Callback set aside by disable_tracking(), restored by enable_tracking()
+    paused_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    # Whether callbacks are delivered from a background thread instead of inline
+    background: bool = False
+    # Pending (callback, node_name, state, elapsed_ns) events for the background thread
+    events: queue.Queue[Tuple[Callable[[str, Dict[str, Any]], None], str, Dict[str, Any], int]] = field(
+        default_factory=queue.Queue)
+
+    def ensure_started(self) -> None:
+        """Record the start time on first use."""
+        if self.start_time_ns is None:
+            # Nodes may run concurrently, so only the first caller may set the start time
+            with _init_lock:
+                if self.start_time_ns is None:
+                    self.start_time_ns = time.perf_counter_ns()
+
+    def get_count(self, node_name: str) -> int:
+        """
+        Get the number of times a node has been invoked.
+        
+        Args:
+            node_name: The name of the node function
+            
+        Returns:
+            The invocation count, or 0 if the node has not run yet
+        """
+        slot = self.counts.get(node_name)
+        if slot is None:
+            return 0
+        return slot[0]
+
+    def node_counts(self) -> Counter:
+        """
+        Get the invocation counts of all nodes that have run.
+        
+        Returns:
+            A Counter mapping node names to invocation counts
+        """
+        counts = Counter()
+        for node_name in self.counts:
+            count = self.get_count(node_name)
+            if count:
+                counts[node_name] = count
+        return counts
+
+    def slot_for(self, node_name: str) -> List[int]:
+        """
+        Get the counter slot for a node, creating it if needed.
+        
+        Args:
+            node_name: The name of the node function
+            
+        Returns:
+            A single-item list holding the node's counter
+        """
+        return self.counts.setdefault(node_name, [0])
+
+    def reset(self) -> None:
+        """Clear the start time and node counts."""
+        self.start_time_ns = None
+        self.elapsed_ns = 0
+        # Reset the counters in place; decorated nodes hold references to these slots
+        with _count_lock:
+            for slot in self.counts.values():
+                slot[0] = 0
+
+
+logger = logging.getLogger(__name__)
 
 # Global progress tracking
-_progress_callback = None
-_start_time = None
-_node_counts = {}
+_init_lock = threading.Lock()
+# Guards the per-node counts, since concurrent nodes may increment the same slot
+_count_lock = threading.Lock()
+_tracker = ProgressTracker()
+_drainer_thread: Optional[threading.Thread] = None
 
-def track_progress(node_func: Callable) -> Callable:
+def _drain_progress_events() -> None:
+    """Deliver queued progress events to their callbacks, in order, forever."""
+    events = _tracker.events
+    while True:
+        callback, node_name, state, elapsed_ns = events.get()
+        try:
+            # Report the elapsed time of this event, not of the latest node to finish
+            _tracker.elapsed_ns = elapsed_ns
+            callback(node_name, state)
+        except Exception:
+            logger.exception("Progress callback failed for node %s", node_name)
+        finally:
+            events.task_done()
+
+def _ensure_drainer() -> None:
+    """Start the progress event drainer thread if it is not running yet."""
+    global _drainer_thread
+    with _init_lock:
+        if _drainer_thread is None:
+            _drainer_thread = threading.Thread(target=_drain_progress_events,
+                                               name="storyteller-progress", daemon=True)
+            _drainer_thread.start()
+
+def _progress_trampoline(tracker: ProgressTracker, node_func: Callable, node_name: str,
+                         slot: List[int], now_ns: Callable[[], int],
+                         state: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Decorator for tracking progress in node functions.
+    Run a node function and report its progress.
+    
+    Shared by every decorated node; track_progress binds the per-node arguments
+    with functools.partial so there is a single code object for all nodes.
     
     Args:
-        node_func: The node function to track
+        tracker: The shared progress tracker
+        node_func: The node function to run
+        node_name: The interned name of the node function
+        slot: The node's counter slot in the tracker
+        now_ns: The clock used for elapsed time
+        state: The current state passed in by LangGraph
         
     Returns:
-        Wrapped function that reports progress
+        The result of the node function
     """
-    @functools.wraps(node_func)
-    def wrapper(state: Dict[str, Any]) -> Dict[str, Any]:
-        global _progress_callback, _start_time, _node_counts
-        
-        # Initialize tracking if needed
-        if _start_time is None:
-            _start_time = time.time()
-            
-        # Get node name
-        node_name = node_func.__name__
+    # Without a listener there is nothing to report, so just run the node
+    callback = tracker.callback
+    if callback is None:
+        return node_func(state)
+    
+    # Initialize tracking if needed
+    tracker.ensure_started()
         
-        # Update node counts
-        if node_name not in _node_counts:
-            _node_counts[node_name] = 0
-        _node_counts[node_name] += 1
+    # Update node counts without a read-modify-write race
+    with _count_lock:
+        slot[0] += 1
+    
+    # Execute the node function
+    result = node_func(state)
+    
+    # Record elapsed time so callbacks don't need to read the clock themselves
+    elapsed_ns = now_ns() - tracker.start_time_ns
+    
+    # Create updated state by merging result into the original state
+    # This ensures we always have the full state context for reporting
+    updated_state = {**state}
+    if isinstance(result, dict):
+        updated_state.update(result)
+    
+    if tracker.background:
+        # Hand the event to the drainer thread so a slow callback doesn't stall the graph
+        tracker.events.put((callback, node_name, updated_state, elapsed_ns))
+    else:
+        tracker.elapsed_ns = elapsed_ns
+        callback(node_name, updated_state)
         
-        # Execute the node function
-        result = node_func(state)
+    return result
+
+def track_progress(node_func: Callable) -> Callable:
+    """
+    Decorator for tracking progress in node functions.
+    
+    Args:
+        node_func: The node function to track
         
-        # Report progress if callback is set
-        if _progress_callback:
-            # Calculate elapsed time
-            elapsed = time.time() - _start_time
-            
-            # Create updated state by merging result into the original state
-            # This ensures we always have the full state context for reporting
-            updated_state = {**state}
-            if isinstance(result, dict):
-                updated_state.update(result)
-            
-            # Call the progress callback with node name and updated state
-            _progress_callback(node_name, updated_state)
-            
-        return result
+    Returns:
+        Wrapped function that reports progress, or node_func itself when
+        STORYTELLER_TRACK_PROGRESS is set to anything other than "1"
+    """
+    # Read at decoration time (after config has loaded .env) so production runs can
+    # opt out and call the bare node functions with no wrapper at all
+    if os.environ.get("STORYTELLER_TRACK_PROGRESS", "1") != "1":
+        return node_func
+    
+    # Resolve the node name, its counter slot and the clock once instead of on every call
+    node_name = sys.intern(node_func.__name__)
+    slot = _tracker.slot_for(node_name)
+    
+    # functools.partial is implemented in C, so binding the per-node arguments to the
+    # shared trampoline avoids creating a Python closure for every node
+    wrapper = functools.partial(_progress_trampoline, _tracker, node_func, node_name, slot,
+                                time.perf_counter_ns)
+    
+    # Copy only what LangGraph and introspection need; functools.wraps does more
+    # work than necessary for every decorated node at import time
+    wrapper.__name__ = node_name
+    wrapper.__qualname__ = node_func.__qualname__
+    wrapper.__wrapped__ = node_func
     
     return wrapper
 
-def set_progress_callback(callback: Optional[Callable[[str, Dict[str, Any]], None]]) -> None:
+def conditional_jit(**kwargs: Any) -> Callable[[Callable], Callable]:
+    """
+    Decorator factory that JIT-compiles numeric helpers when numba is available.
+    
+    numba is an optional dependency; without it the decorated function is
+    returned unchanged.
+    
+    Args:
+        **kwargs: Extra options passed through to numba.njit
+        
+    Returns:
+        A decorator for the function to compile
+    """
+    try:
+        import numba
+    except ImportError:
+        return lambda func: func
+    
+    # Cache compiled code on disk so the compile cost is only paid once
+    kwargs.setdefault("cache", True)
+    return numba.njit(**kwargs)
+
+def set_progress_callback(callback: Optional[Callable[[str, Dict[str, Any]], None]],
+                          background: bool = False) -> None:
     """
     Set the global progress tracking callback.
     
     Args:
         callback: Function to call for progress updates or None to disable
+        background: Whether to deliver updates from a background thread so a slow
+            callback doesn't stall the graph (default: False). Queued events carry a
+            shallow copy of the state, so nested values a later node mutates in place
+            show their newer content; the callback should read the elapsed time from
+            snapshot_progress() rather than its own clock.
+    """
+    if callback is not None and background:
+        _ensure_drainer()
+    _tracker.background = background
+    _tracker.callback = callback
+    _tracker.paused_callback = None
+    _tracker.reset()
+
+def disable_tracking() -> None:
+    """
+    Temporarily stop progress reporting without forgetting the registered callback.
+    
+    Decorated nodes take the same fast path as when no callback is set.
     """
-    global _progress_callback, _start_time, _node_counts
-    _progress_callback = callback
-    _start_time = None
-    _node_counts = {}
+    if _tracker.callback is not None:
+        _tracker.paused_callback = _tracker.callback
+        _tracker.callback = None
+
+def enable_tracking() -> None:
+    """Resume progress reporting with the callback set aside by disable_tracking()."""
+    if _tracker.paused_callback is not None:
+        _tracker.callback = _tracker.paused_callback
+        _tracker.paused_callback = None
 
 def reset_progress_tracking() -> None:
-    """Reset all progress tracking variables."""
-    global _progress_callback, _start_time, _node_counts
-    _start_time = None
-    _node_counts = {}
+    """
+    Reset all progress tracking variables.
+    
+    The tracker is reset in place, so observers holding a reference to it (or to
+    its counts) keep seeing live values.
+    """
+    _tracker.reset()
 
-# Export public API
-from storyteller_lib.storyteller import generate_story
+def flush_progress() -> None:
+    """Block until every queued progress event has been delivered to its callback."""
+    _tracker.events.join()
+
+def snapshot_progress() -> Dict[str, Any]:
+    """
+    Take a point-in-time copy of the progress tracking state.
+    
+    Returns:
+        A dictionary with per-node invocation counts and elapsed time
+    """
+    elapsed_ns = _tracker.elapsed_ns
+    return {
+        "node_counts": dict(_tracker.node_counts()),
+        "elapsed_ns": elapsed_ns,
+        # Convert to seconds only here, at the reporting boundary
+        "elapsed_seconds": elapsed_ns * 1e-9
+    }
 
-__all__ = ["generate_story", "track_progress", "set_progress_callback", "reset_progress_tracking"]
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """
+    Lazily resolve heavy public attributes on first access (PEP 562).
+    
+    Importing generate_story pulls in the whole LangGraph/LangChain stack, so it
+    is deferred until someone actually asks for it.
+    
+    Args:
+        name: The attribute being looked up on the package
+        
+    Returns:
+        The requested attribute
+    """
+    if name == "generate_story":
+        from storyteller_lib.storyteller import generate_story
+        globals()["generate_story"] = generate_story
+        return generate_story
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Export public API
+__all__ = (
+    "generate_story",
+    "track_progress",
+    "conditional_jit",
+    "set_progress_callback",
+    "enable_tracking",
+    "disable_tracking",
+    "reset_progress_tracking",
+    "flush_progress",
+    "snapshot_progress",
+)
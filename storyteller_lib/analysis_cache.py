@@ -0,0 +1,117 @@
+"""
+StoryCraft Agent - Persistent cache for structured analysis results.
+
+This module provides a small SQLite-backed key/value cache for the results of
+deterministic-input LLM analyses, so that identical inputs skip the LLM round-trip
+on reruns of the workflow. Like the LLM cache it sits next to, it is only used while
+an LLM cache is configured, and its entries are scoped to the model that produced them.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.globals import get_llm_cache
+from langchain_core.language_models import BaseChatModel
+
+from storyteller_lib.config import ANALYSIS_CACHE_LOCATION, llm
+
+
+def content_key(*parts: str) -> str:
+    """
+    Build a stable cache key from the inputs of an analysis.
+    
+    Args:
+        *parts: The input strings that fully determine the analysis result
+        
+    Returns:
+        A hex digest identifying the inputs
+    """
+    return hashlib.blake2b("\x00".join(parts).encode("utf-8"), digest_size=32).hexdigest()
+
+
+def _model_identity(model: BaseChatModel) -> str:
+    """
+    Describe the chat model whose output is being cached.
+    
+    Args:
+        model: The chat model
+        
+    Returns:
+        The model class, model name and temperature, e.g. "ChatOpenAI:gpt-4o:0.7"
+    """
+    model_name = getattr(model, "model_name", None) or getattr(model, "model", "")
+    return f"{type(model).__name__}:{model_name}:{getattr(model, 'temperature', '')}"
+
+
+class AnalysisCache:
+    """
+    SQLite-backed cache mapping (namespace, key) pairs to serialized results.
+    
+    Values are stored as strings (typically JSON) so callers decide how to
+    serialize and rehydrate them. Namespaces are prefixed with the model identity,
+    so switching providers or models never returns another model's analysis, and
+    lookups and stores are skipped while LLM caching is disabled (--cache none).
+    """
+    
+    def __init__(self, path: str, model: str):
+        """
+        Open (and if needed create) the cache database.
+        
+        Args:
+            path: The path of the SQLite database file
+            model: The identity of the model whose results are cached
+        """
+        self.model = model
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+    
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        """
+        Look up a cached value.
+        
+        Args:
+            namespace: The analysis the value belongs to
+            key: The content key of the analysis inputs
+            
+        Returns:
+            The cached value, or None on a miss or while LLM caching is disabled
+        """
+        if get_llm_cache() is None:
+            return None
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value FROM analysis_cache WHERE namespace = ? AND key = ?",
+                (f"{self.model}:{namespace}", key)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, namespace: str, key: str, value: str) -> None:
+        """
+        Store a value, replacing any previous value for the same inputs.
+        
+        Args:
+            namespace: The analysis the value belongs to
+            key: The content key of the analysis inputs
+            value: The serialized result
+        """
+        if get_llm_cache() is None:
+            return
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (namespace, key, value) VALUES (?, ?, ?)",
+                (f"{self.model}:{namespace}", key, value)
+            )
+
+
+# Shared cache instance
+analysis_cache = AnalysisCache(ANALYSIS_CACHE_LOCATION, _model_identity(llm))
@@ -61,6 +61,8 @@ DEFAULT_MODEL_PROVIDER = os.environ.get("DEFAULT_MODEL_PROVIDER", DEFAULT_PROVID
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_CACHE_TYPE = "sqlite"  # Only sqlite cache is supported
 CACHE_LOCATION = os.environ.get("CACHE_LOCATION", str(Path.home() / ".storyteller" / "llm_cache.db"))
+# Define the path for the SQLite cache of structured analysis results
+ANALYSIS_CACHE_LOCATION = os.environ.get("ANALYSIS_CACHE_LOCATION", str(Path.home() / ".storyteller" / "analysis_cache.db"))
 # Define the path for the SQLite memory database
 MEMORY_DB_PATH = os.environ.get("MEMORY_DB_PATH", str(Path.home() / ".storyteller" / "memory.sqlite"))
 
@@ -93,6 +95,8 @@ def setup_cache(cache_type: str = DEFAULT_CACHE_TYPE) -> Optional[BaseCache]:
         The configured cache instance
     """
     if cache_type.lower() == "none":
+        # Also clear a cache set up at import time, so --cache none really disables caching
+        set_llm_cache(None)
         logger.info("LLM caching disabled")
         return None
     
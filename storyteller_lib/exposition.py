@@ -5,12 +5,418 @@ This module provides functionality to track and manage key concepts that need cl
 addressing issues with unclear introduction of important story elements in multiple languages.
 """
 
-from typing import Dict, List, Any, Optional
-from langchain_core.messages import HumanMessage
+import copy
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Literal, Optional
+from pydantic import BaseModel, Field, field_validator
+from langchain_core.messages import HumanMessage, SystemMessage
 from storyteller_lib.config import llm, manage_memory_tool, search_memory_tool, MEMORY_NAMESPACE, DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES
 from storyteller_lib.models import StoryState
+from storyteller_lib.analysis_cache import analysis_cache, content_key
 
-def identify_key_concepts(global_story: str, genre: str, language: str = DEFAULT_LANGUAGE) -> Dict[str, Any]:
+logger = logging.getLogger(__name__)
+
+# Pydantic models for structured output
+class KeyConcept(BaseModel):
+    """A key concept that needs clear exposition."""
+
+    name: str = Field(
+        description="Name of the key concept"
+    )
+    description: str = Field(
+        description="Brief description of the concept"
+    )
+    importance: Literal["high", "medium", "low"] = Field(
+        description="Importance to the story"
+    )
+    recommended_chapter: str = Field(
+        description="Recommended chapter for introduction"
+    )
+    exposition_approach: str = Field(
+        description="Recommended exposition approach"
+    )
+    introduced: bool = Field(
+        default=False,
+        description="Whether the concept has been introduced"
+    )
+    introduction_chapter: str = Field(
+        default="",
+        description="Chapter where concept was introduced"
+    )
+    introduction_scene: str = Field(
+        default="",
+        description="Scene where concept was introduced"
+    )
+    clarity_score: int = Field(
+        default=0, ge=0, le=10,
+        description="Clarity of exposition (0=not introduced, 10=perfectly clear)"
+    )
+
+class KeyConceptsAnalysis(BaseModel):
+    """Analysis of key concepts in a story."""
+
+    key_concepts: List[KeyConcept] = Field(
+        default_factory=list,
+        description="List of key concepts"
+    )
+
+class ConceptClarity(BaseModel):
+    """Analysis of concept clarity in a scene."""
+
+    concept_name: str = Field(
+        description="Name of the concept"
+    )
+    clarity_score: int = Field(
+        ge=1, le=10,
+        description="Clarity score (1=unclear, 10=perfectly clear)"
+    )
+    introduction_text: str = Field(
+        description="The specific text that introduces the concept"
+    )
+    exposition_method: str = Field(
+        description="How the concept is introduced (dialogue, narration, etc.)"
+    )
+    natural_integration: int = Field(
+        ge=1, le=10,
+        description="How naturally the concept is integrated (1=forced, 10=seamless)"
+    )
+    strengths: List[str] = Field(
+        default_factory=list,
+        description="Strengths of the exposition"
+    )
+    weaknesses: List[str] = Field(
+        default_factory=list,
+        description="Weaknesses of the exposition"
+    )
+    improvement_suggestions: List[str] = Field(
+        default_factory=list,
+        description="Suggestions for improvement"
+    )
+
+class TellingPassages(BaseModel):
+    """Passages that tell rather than show."""
+    passages: List[str] = Field(
+        description="List of passages that tell rather than show"
+    )
+
+class TellingInstance(BaseModel):
+    """An instance of telling rather than showing."""
+    text: str = Field(
+        description="The text that tells rather than shows"
+    )
+    issue: str = Field(
+        description="What type of telling issue this is"
+    )
+    improvement_suggestion: str = Field(
+        description="Suggestion for how to convert to showing"
+    )
+
+class ShowingInstance(BaseModel):
+    """An instance of effective showing."""
+    text: str = Field(
+        description="The text that effectively shows"
+    )
+    strength: str = Field(
+        description="What makes this an effective example of showing"
+    )
+
+class ShowingTellingAnalysis(BaseModel):
+    """Analysis of showing vs. telling in a scene."""
+    sensory_details_score: int = Field(
+        ge=1, le=10,
+        description="Effectiveness of sensory details (1=poor, 10=excellent)"
+    )
+    emotion_showing_score: int = Field(
+        ge=1, le=10,
+        description="How well emotions are shown rather than told"
+    )
+    world_element_showing_score: int = Field(
+        ge=1, le=10,
+        description="How well world elements are shown rather than explained"
+    )
+    character_development_showing_score: int = Field(
+        ge=1, le=10,
+        description="How well character development is shown rather than described"
+    )
+    overall_showing_ratio: int = Field(
+        ge=1, le=10,
+        description="Overall ratio of showing to telling (1=all telling, 10=all showing)"
+    )
+    telling_instances: List[TellingInstance] = Field(
+        default_factory=list,
+        description="Instances of telling that could be improved"
+    )
+    showing_instances: List[ShowingInstance] = Field(
+        default_factory=list,
+        description="Examples of effective showing"
+    )
+    missed_opportunities: List[str] = Field(
+        default_factory=list,
+        description="Missed opportunities for sensory details"
+    )
+    improvement_suggestions: List[str] = Field(
+        default_factory=list,
+        description="General suggestions for improving showing vs. telling"
+    )
+
+    # Custom validator to handle string inputs for list fields
+    @classmethod
+    def validate_list_fields(cls, v, field):
+        """Handle cases where the LLM returns a string instead of a list."""
+        if isinstance(v, str):
+            # Try to parse the string as JSON
+            try:
+                parsed = json.loads(v)
+                if isinstance(parsed, list):
+                    return parsed
+            except ValueError:
+                pass
+            # If parsing fails, return an empty list
+            return []
+        return v
+
+    @field_validator('showing_instances', 'telling_instances', 'missed_opportunities', 'improvement_suggestions', mode='before')
+    def validate_lists(cls, v, info):
+        return cls.validate_list_fields(v, info.field_name)
+
+class ChecklistForConcept(BaseModel):
+    """A sensory checklist for one concept."""
+    id: int = Field(
+        description="The id of the concept from the input list"
+    )
+    checklist: str = Field(
+        description="The sensory checklist for the concept"
+    )
+
+class ChecklistBatch(BaseModel):
+    """Sensory checklists for a batch of concepts."""
+    items: List[ChecklistForConcept] = Field(
+        default_factory=list,
+        description="One checklist per input concept"
+    )
+
+class SimpleShowingTellingAnalysis(BaseModel):
+    """Showing vs. telling scores only, used when the detailed analysis fails to parse."""
+    sensory_details_score: int = Field(ge=1, le=10)
+    emotion_showing_score: int = Field(ge=1, le=10)
+    world_element_showing_score: int = Field(ge=1, le=10)
+    character_development_showing_score: int = Field(ge=1, le=10)
+    overall_showing_ratio: int = Field(ge=1, le=10)
+
+# Structured-output runnables are built once at import instead of on every call
+_KEY_CONCEPTS_LLM = llm.with_structured_output(KeyConceptsAnalysis)
+_CONCEPT_CLARITY_LLM = llm.with_structured_output(ConceptClarity)
+_TELLING_PASSAGES_LLM = llm.with_structured_output(TellingPassages)
+_SHOWING_TELLING_LLM = llm.with_structured_output(ShowingTellingAnalysis)
+_SIMPLE_SHOWING_TELLING_LLM = llm.with_structured_output(SimpleShowingTellingAnalysis)
+_CHECKLIST_BATCH_LLM = llm.with_structured_output(ChecklistBatch)
+
+# Guidance text that does not depend on the concepts, appended to every exposition guidance
+_SHOWING_TELLING_GUIDANCE = """
+    SHOWING VS. TELLING FOR CONCEPT INTRODUCTION:
+    
+    Instead of explaining concepts directly, demonstrate them through:
+    
+    1. CHARACTER INTERACTIONS:
+       - Show characters using or encountering the concept
+       - Reveal information through character reactions
+       - Use dialogue that naturally incorporates the concept
+    
+    2. SENSORY EXPERIENCES:
+       - Describe how the concept looks, sounds, smells, feels, or tastes
+       - Show physical manifestations of abstract concepts
+       - Create vivid imagery that embodies the concept
+    
+    3. ENVIRONMENTAL CUES:
+       - Use the setting to reflect or embody the concept
+       - Show how the concept affects the environment
+       - Create atmosphere that reinforces the concept
+    
+    4. CONCRETE EXAMPLES:
+       - Show specific instances rather than general explanations
+       - Use representative examples that illustrate the concept
+       - Create symbolic objects or events that embody the concept
+    """
+
+# Static instructions sent as system messages. They contain no per-call values, so the
+# request prefix is byte-identical across calls and provider prompt caches can reuse it;
+# only the story content and language go into the user message.
+_SYSTEM_IDENTIFY_CONCEPTS = """
+    You identify key concepts in story outlines that will need clear exposition.
+    
+    For each key concept (e.g., unique world elements, magic systems, historical events, organizations, cultural practices),
+    provide:
+    1. Concept name (in the language of the story)
+    2. Brief description (in the language of the story)
+    3. Importance to the story (high, medium, low)
+    4. Recommended chapter for introduction
+    5. Recommended exposition approach (dialogue, narration, flashback, etc.)
+    
+    Focus on concepts that are:
+    - Unique to this story world
+    - Critical to understanding the plot
+    - Potentially confusing without proper explanation
+    - Referenced multiple times throughout the story
+    - Culturally relevant in the literature of the story's language
+    """
+
+_SYSTEM_CONCEPT_CLARITY = """
+    You analyze how clearly a story concept is explained in a scene.
+    
+    Evaluate:
+    1. Is the concept clearly introduced?
+    2. Is enough information provided for the reader to understand the concept?
+    3. Is the exposition natural or forced?
+    4. Is the concept integrated into the story or just explained?
+    5. Are there any aspects of the concept that remain unclear?
+    6. Does the exposition respect cultural and linguistic norms of the scene's language?
+    
+    Provide:
+    - A clarity score from 1-10 (where 10 is perfectly clear)
+    - The specific text that introduces the concept (in the original language)
+    - Strengths of the exposition
+    - Weaknesses of the exposition
+    - Suggestions for improvement that are appropriate for literature in that language
+    """
+
+_SYSTEM_EXPOSITION_GUIDANCE = """
+    You write exposition guidance for introducing story concepts in a scene.
+    
+    Provide guidance on:
+    1. How to introduce these concepts naturally and clearly in the story's language
+    2. How to avoid info-dumping
+    3. How to integrate the concepts into the narrative
+    4. How to ensure the reader understands the concepts' importance
+    5. Common exposition pitfalls to avoid in this genre
+    6. Language-specific exposition techniques for the story's language
+    7. Cultural considerations for introducing concepts in literature of that language
+    
+    Format your response as concise, actionable guidelines that could be included in a scene writing prompt.
+    Focus on creating clear, engaging exposition appropriate for the genre, tone, and language.
+    """
+
+_SYSTEM_EXPOSITION_TO_SENSORY = """
+    You convert expository text into sensory descriptions that show rather than tell.
+    
+    Focus on:
+    - Visual details (what would a character SEE?)
+    - Sounds (what would a character HEAR?)
+    - Smells, tastes, and textures (what physical sensations are associated?)
+    - Character reactions and emotions (how do characters physically respond?)
+    - Environmental cues (how does the environment reflect the information?)
+    
+    EXAMPLES:
+    
+    TELLING: "The Sülfmeister were resentful of the Patrizier's power over the salt trade."
+    SHOWING: "Müller's knuckles whitened around his salt measure as the Patrizier's tax collector approached. The other Sülfmeister exchanged glances, their shoulders tensing beneath salt-crusted coats. No one spoke, but their silence carried the weight of generations of resentment."
+    
+    TELLING: "The Salzmal was an ancient salt tax that caused conflict between social classes."
+    SHOWING: "The iron seal of the Salzmal glinted on the collection box, its worn edges smoothed by centuries of reluctant tributes. When it appeared, conversations hushed and eyes darted to worn boots. A Sülfmeister spat on the ground, the gesture small but defiant, while the Patrizier's man adjusted his clean collar with manicured fingers."
+    
+    Return only the converted text with no explanations or comments.
+    """
+
+_SYSTEM_TELLING_PASSAGES = """
+    You identify passages in a scene that "tell" rather than "show".
+    
+    Look for:
+    1. Direct statements about emotions rather than physical manifestations
+    2. Explanations of world elements rather than interactions with them
+    3. Abstract descriptions rather than concrete sensory details
+    4. Statements that explain character traits rather than demonstrating them
+    5. Exposition that could be converted to action, dialogue, or sensory experience
+    
+    For each passage, extract ONLY the exact text that should be converted to showing.
+    """
+
+_SYSTEM_SHOWING_TELLING = """
+    You analyze scenes for the balance of showing vs. telling.
+    
+    Evaluate:
+    1. How effectively does the scene use sensory details?
+    2. Are emotions shown through physical manifestations or just stated?
+    3. Are world elements experienced through character interaction or just explained?
+    4. Is character development demonstrated through actions or just described?
+    5. What is the overall ratio of showing to telling?
+    
+    Identify specific examples of:
+    - Effective showing (with excerpts)
+    - Instances of telling that could be improved (with excerpts)
+    - Missed opportunities for sensory details
+    """
+
+_SYSTEM_SIMPLE_SHOWING_TELLING = """
+    You score scenes for the balance of showing vs. telling.
+    
+    Evaluate on a 1-10 scale:
+    - How effectively does the scene use sensory details?
+    - Are emotions shown through physical manifestations or just stated?
+    - Are world elements experienced through character interaction or just explained?
+    - Is character development demonstrated through actions or just described?
+    - What is the overall ratio of showing to telling?
+    """
+
+_SYSTEM_SENSORY_CHECKLIST = """
+    You create sensory checklists for introducing story concepts.
+    
+    Create a checklist of sensory details that could be used to introduce the concept through showing rather than telling.
+    Include at least one item for each sensory category:
+    - Visual details
+    - Sounds
+    - Smells/tastes
+    - Textures/physical sensations
+    - Character reactions
+    - Cultural sensory associations in cultures that speak the story's language
+    
+    Format your response as a concise, actionable checklist.
+    """
+
+_SYSTEM_SENSORY_CHECKLIST_BATCH = """
+    You create sensory checklists for introducing story concepts.
+    
+    For each concept, create a checklist of sensory details that could be used to introduce it through showing rather than telling.
+    Include at least one item for each sensory category:
+    - Visual details
+    - Sounds
+    - Smells/tastes
+    - Textures/physical sensations
+    - Character reactions
+    - Cultural sensory associations in cultures that speak the story's language
+    
+    Return exactly one item per concept, using the concept's id.
+    Format each checklist as a concise, actionable checklist.
+    """
+
+# Fallback templates used when the LLM request fails
+_FALLBACK_EXPOSITION_GUIDANCE = """
+        EXPOSITION GUIDANCE FOR {language_name_upper}:
+        1. Introduce these key concepts clearly in this scene:
+        {concepts_text}
+        
+        2. Guidelines for clear exposition in {language_name}:
+           - Introduce concepts organically through character interaction or observation
+           - Avoid info-dumping - break exposition into digestible pieces
+           - Show rather than tell when possible
+           - Use character questions or confusion to naturally explain concepts
+           - Ensure the reader understands the concept's importance to the story
+           - Consider cultural context and linguistic norms specific to {language_name}
+           - Use idiomatic expressions and natural speech patterns in {language_name}
+           - Adapt exposition techniques to match {language_name} literary traditions
+        """
+
+_FALLBACK_SENSORY_CHECKLIST = """
+        Sensory Checklist for {name}:
+        - Visual: Show a physical manifestation of the concept
+        - Sound: Include sounds associated with the concept
+        - Smell/Taste: Add olfactory or gustatory details
+        - Touch: Describe textures or physical sensations
+        - Reaction: Show character physical/emotional reactions
+        """
+
+def identify_key_concepts(global_story: str, genre: str, language: str = DEFAULT_LANGUAGE,
+                          cache: bool = True) -> Dict[str, Any]:
     """
     Identify key concepts in the story that will need clear exposition.
     
@@ -18,15 +424,23 @@ def identify_key_concepts(global_story: str, genre: str, language: str = DEFAULT
         global_story: The overall story outline
         genre: The genre of the story
         language: The language of the story (default: from config)
+        cache: Whether to reuse a stored result for identical inputs (default: True)
         
     Returns:
         A dictionary with key concepts information
     """
     # Validate language
     if language not in SUPPORTED_LANGUAGES:
-        print(f"Warning: Unsupported language '{language}'. Falling back to {DEFAULT_LANGUAGE}.")
+        logger.warning("Unsupported language '%s'. Falling back to %s.", language, DEFAULT_LANGUAGE)
         language = DEFAULT_LANGUAGE
     
+    # Reruns of the workflow with the same outline skip the LLM entirely
+    cache_key = content_key(genre, language, global_story)
+    if cache:
+        cached = analysis_cache.get("key_concepts", cache_key)
+        if cached is not None:
+            return KeyConceptsAnalysis.model_validate_json(cached).model_dump()
+    
     # Get the full language name
     language_name = SUPPORTED_LANGUAGES[language]
     
@@ -36,87 +450,98 @@ def identify_key_concepts(global_story: str, genre: str, language: str = DEFAULT
     
     {global_story}
     
-    For each key concept (e.g., unique world elements, magic systems, historical events, organizations, cultural practices),
-    provide:
-    1. Concept name (in {language_name})
-    2. Brief description (in {language_name})
-    3. Importance to the story (high, medium, low)
-    4. Recommended chapter for introduction
-    5. Recommended exposition approach (dialogue, narration, flashback, etc.)
-    
-    Focus on concepts that are:
-    - Unique to this story world
-    - Critical to understanding the plot
-    - Potentially confusing without proper explanation
-    - Referenced multiple times throughout the story
-    - Culturally relevant in {language_name} literature
-    
     Analyze and respond in {language_name}.
     """
     
     try:
-        # Define Pydantic models for structured output
-        from pydantic import BaseModel, Field, field_validator
-        from typing import List, Literal
-        
-        class KeyConcept(BaseModel):
-            """A key concept that needs clear exposition."""
-            
-            name: str = Field(
-                description="Name of the key concept"
-            )
-            description: str = Field(
-                description="Brief description of the concept"
-            )
-            importance: Literal["high", "medium", "low"] = Field(
-                description="Importance to the story"
-            )
-            recommended_chapter: str = Field(
-                description="Recommended chapter for introduction"
-            )
-            exposition_approach: str = Field(
-                description="Recommended exposition approach"
-            )
-            introduced: bool = Field(
-                default=False,
-                description="Whether the concept has been introduced"
-            )
-            introduction_chapter: str = Field(
-                default="",
-                description="Chapter where concept was introduced"
-            )
-            introduction_scene: str = Field(
-                default="",
-                description="Scene where concept was introduced"
-            )
-            clarity_score: int = Field(
-                default=0, ge=0, le=10,
-                description="Clarity of exposition (0=not introduced, 10=perfectly clear)"
-            )
-        
-        class KeyConceptsAnalysis(BaseModel):
-            """Analysis of key concepts in a story."""
-            
-            key_concepts: List[KeyConcept] = Field(
-                default_factory=list,
-                description="List of key concepts"
-            )
-        
-        # Create a structured LLM that outputs a KeyConceptsAnalysis
-        structured_llm = llm.with_structured_output(KeyConceptsAnalysis)
-        
         # Use the structured LLM to identify key concepts
-        key_concepts_analysis = structured_llm.invoke(prompt)
+        key_concepts_analysis = _KEY_CONCEPTS_LLM.invoke([SystemMessage(content=_SYSTEM_IDENTIFY_CONCEPTS), HumanMessage(content=prompt)])
         
         # Convert Pydantic model to dictionary
-        return key_concepts_analysis.dict()
+        result = key_concepts_analysis.model_dump()
+        
+        # Only successful analyses are cached; errors fall through to a retry next time
+        if cache:
+            analysis_cache.set("key_concepts", cache_key, key_concepts_analysis.model_dump_json())
+        
+        return result
     
-    except Exception as e:
-        print(f"Error identifying key concepts: {str(e)}")
+    except Exception:
+        logger.exception("Error identifying key concepts")
         return {
             "key_concepts": []
         }
 
+# The key concepts tracker last read from or written to memory, with a chapter
+# lookup over its concept dicts. The cached objects never leave this module; callers
+# receive copies, and status updates replace the tracker instead of mutating it.
+_tracker_cache: Dict[str, Any] = {
+    "tracker": None,
+    "by_chapter": {}
+}
+
+def _cache_tracker(key_concepts_tracker: Dict[str, Any]) -> None:
+    """
+    Cache a key concepts tracker and rebuild its chapter index.
+    
+    Args:
+        key_concepts_tracker: The tracker to cache
+    """
+    by_chapter = {}
+    for concept in key_concepts_tracker.get("key_concepts", []):
+        by_chapter.setdefault(concept["recommended_chapter"], []).append(concept)
+    
+    _tracker_cache["tracker"] = key_concepts_tracker
+    _tracker_cache["by_chapter"] = by_chapter
+
+def _get_tracker() -> Optional[Dict[str, Any]]:
+    """
+    Get the key concepts tracker, searching memory only on the first access.
+    
+    Returns:
+        The key concepts tracker, or None if it has not been stored yet
+    """
+    cached = _tracker_cache["tracker"]
+    if cached is not None:
+        return cached
+    
+    results = search_memory_tool.invoke({
+        "query": "key_concepts_tracker",
+        "namespace": MEMORY_NAMESPACE
+    })
+    
+    key_concepts_tracker = None
+    if results:
+        # Handle different return types from search_memory_tool
+        if isinstance(results, dict) and "value" in results:
+            key_concepts_tracker = results["value"]
+        elif isinstance(results, list):
+            for item in results:
+                if hasattr(item, 'key') and item.key == "key_concepts_tracker":
+                    key_concepts_tracker = item.value
+                    break
+    
+    if key_concepts_tracker:
+        _cache_tracker(key_concepts_tracker)
+    return key_concepts_tracker
+
+def _store_tracker(key_concepts_tracker: Dict[str, Any]) -> None:
+    """
+    Write the key concepts tracker to memory and keep it as the cached copy.
+    
+    The tracker is owned by the cache afterwards and must not be mutated.
+    
+    Args:
+        key_concepts_tracker: The tracker to store
+    """
+    manage_memory_tool.invoke({
+        "action": "create",
+        "key": "key_concepts_tracker",
+        "value": key_concepts_tracker,
+        "namespace": MEMORY_NAMESPACE
+    })
+    _cache_tracker(key_concepts_tracker)
+
 def track_key_concepts(state: StoryState) -> Dict:
     """
     Track and manage key concepts that need clear exposition.
@@ -138,15 +563,10 @@ def track_key_concepts(state: StoryState) -> Dict:
     key_concepts_analysis = identify_key_concepts(global_story, genre, language)
     
     # Store key concepts in memory
-    manage_memory_tool.invoke({
-        "action": "create",
-        "key": "key_concepts_tracker",
-        "value": key_concepts_analysis,
-        "namespace": MEMORY_NAMESPACE
-    })
+    _store_tracker(key_concepts_analysis)
     
     return {
-        "key_concepts_tracker": key_concepts_analysis
+        "key_concepts_tracker": copy.deepcopy(key_concepts_analysis)
     }
 
 def check_concept_introduction(state: StoryState) -> Dict[str, Any]:
@@ -165,30 +585,17 @@ def check_concept_introduction(state: StoryState) -> Dict[str, Any]:
     
     # Retrieve key concepts tracker from memory
     try:
-        results = search_memory_tool.invoke({
-            "query": "key_concepts_tracker",
-            "namespace": MEMORY_NAMESPACE
-        })
-        
-        key_concepts_tracker = None
-        if results:
-            # Handle different return types from search_memory_tool
-            if isinstance(results, dict) and "value" in results:
-                key_concepts_tracker = results["value"]
-            elif isinstance(results, list):
-                for item in results:
-                    if hasattr(item, 'key') and item.key == "key_concepts_tracker":
-                        key_concepts_tracker = item.value
-                        break
+        key_concepts_tracker = _get_tracker()
         
         if not key_concepts_tracker:
             return {}
         
         # Check which concepts should be introduced in this chapter
         concepts_for_current_chapter = []
-        for concept in key_concepts_tracker["key_concepts"]:
-            if concept["recommended_chapter"] == current_chapter and not concept["introduced"]:
-                concepts_for_current_chapter.append(concept)
+        by_chapter = _tracker_cache["by_chapter"]
+        for concept in by_chapter.get(current_chapter, []):
+            if not concept["introduced"]:
+                concepts_for_current_chapter.append(copy.deepcopy(concept))
         
         if not concepts_for_current_chapter:
             return {}
@@ -198,17 +605,17 @@ def check_concept_introduction(state: StoryState) -> Dict[str, Any]:
             "concepts_to_introduce": concepts_for_current_chapter
         }
     
-    except Exception as e:
-        print(f"Error checking concept introduction: {str(e)}")
+    except Exception:
+        logger.exception("Error checking concept introduction")
         return {}
 
-def update_concept_introduction_status(state: StoryState, concept_name: str) -> Dict:
+def update_concept_introductions(state: StoryState, concept_names: List[str]) -> Dict:
     """
-    Update the introduction status of a key concept.
+    Update the introduction status of several key concepts with a single memory write.
     
     Args:
         state: The current state
-        concept_name: The name of the concept that was introduced
+        concept_names: The names of the concepts that were introduced
         
     Returns:
         Updates to the state
@@ -216,59 +623,55 @@ def update_concept_introduction_status(state: StoryState, concept_name: str) ->
     current_chapter = state["current_chapter"]
     current_scene = state["current_scene"]
     
+    if not concept_names:
+        return {}
+    
     # Retrieve key concepts tracker from memory
     try:
-        results = search_memory_tool.invoke({
-            "query": "key_concepts_tracker",
-            "namespace": MEMORY_NAMESPACE
-        })
-        
-        key_concepts_tracker = None
-        if results:
-            # Handle different return types from search_memory_tool
-            if isinstance(results, dict) and "value" in results:
-                key_concepts_tracker = results["value"]
-            elif isinstance(results, list):
-                for item in results:
-                    if hasattr(item, 'key') and item.key == "key_concepts_tracker":
-                        key_concepts_tracker = item.value
-                        break
+        key_concepts_tracker = _get_tracker()
         
         if not key_concepts_tracker:
             return {}
         
-        # Update the concept introduction status
-        updated_concepts = []
-        for concept in key_concepts_tracker["key_concepts"]:
-            if concept["name"] == concept_name:
-                concept["introduced"] = True
-                concept["introduction_chapter"] = current_chapter
-                concept["introduction_scene"] = current_scene
-                concept["clarity_score"] = 7  # Initial clarity score after introduction
-            
-            updated_concepts.append(concept)
-        
-        # Update the key concepts tracker
-        updated_tracker = {
-            "key_concepts": updated_concepts
-        }
+        # Build an updated tracker; the cached concept dicts may already be referenced elsewhere
+        introduced = set(concept_names)
+        key_concepts = []
+        for concept in key_concepts_tracker.get("key_concepts", []):
+            if concept["name"] in introduced:
+                concept = {
+                    **concept,
+                    "introduced": True,
+                    "introduction_chapter": current_chapter,
+                    "introduction_scene": current_scene,
+                    "clarity_score": 7  # Initial clarity score after introduction
+                }
+            key_concepts.append(concept)
+        key_concepts_tracker = {**key_concepts_tracker, "key_concepts": key_concepts}
         
         # Store the updated tracker in memory
-        manage_memory_tool.invoke({
-            "action": "create",
-            "key": "key_concepts_tracker",
-            "value": updated_tracker,
-            "namespace": MEMORY_NAMESPACE
-        })
+        _store_tracker(key_concepts_tracker)
         
         return {
-            "key_concepts_tracker": updated_tracker
+            "key_concepts_tracker": copy.deepcopy(key_concepts_tracker)
         }
     
-    except Exception as e:
-        print(f"Error updating concept introduction status: {str(e)}")
+    except Exception:
+        logger.exception("Error updating concept introduction status")
         return {}
 
+def update_concept_introduction_status(state: StoryState, concept_name: str) -> Dict:
+    """
+    Update the introduction status of a key concept.
+    
+    Args:
+        state: The current state
+        concept_name: The name of the concept that was introduced
+        
+    Returns:
+        Updates to the state
+    """
+    return update_concept_introductions(state, [concept_name])
+
 def analyze_concept_clarity(scene_content: str, concept_name: str, language: str = DEFAULT_LANGUAGE) -> Dict[str, Any]:
     """
     Analyze how clearly a concept is explained in a scene.
@@ -283,12 +686,18 @@ def analyze_concept_clarity(scene_content: str, concept_name: str, language: str
     """
     # Validate language
     if language not in SUPPORTED_LANGUAGES:
-        print(f"Warning: Unsupported language '{language}'. Falling back to {DEFAULT_LANGUAGE}.")
+        logger.warning("Unsupported language '%s'. Falling back to %s.", language, DEFAULT_LANGUAGE)
         language = DEFAULT_LANGUAGE
     
     # Get the full language name
     language_name = SUPPORTED_LANGUAGES[language]
     
+    # Scene drafts are often re-analysed without changes
+    cache_key = content_key(language, concept_name, scene_content)
+    cached = analysis_cache.get("concept_clarity", cache_key)
+    if cached is not None:
+        return ConceptClarity.model_validate_json(cached).model_dump()
+    
     # Prepare the prompt for analyzing concept clarity
     prompt = f"""
     Analyze how clearly this concept is explained in the scene written in {language_name}:
@@ -298,73 +707,21 @@ def analyze_concept_clarity(scene_content: str, concept_name: str, language: str
     SCENE CONTENT:
     {scene_content}
     
-    Evaluate:
-    1. Is the concept clearly introduced?
-    2. Is enough information provided for the reader to understand the concept?
-    3. Is the exposition natural or forced?
-    4. Is the concept integrated into the story or just explained?
-    5. Are there any aspects of the concept that remain unclear?
-    6. Does the exposition respect cultural and linguistic norms of {language_name}?
-    
-    Provide:
-    - A clarity score from 1-10 (where 10 is perfectly clear)
-    - The specific text that introduces the concept (in the original {language_name})
-    - Strengths of the exposition
-    - Weaknesses of the exposition
-    - Suggestions for improvement that are appropriate for {language_name} literature
-    
     Analyze and respond in {language_name}.
     """
     
     try:
-        # Define Pydantic models for structured output
-        from pydantic import BaseModel, Field, field_validator
-        from typing import List, Optional
-        
-        class ConceptClarity(BaseModel):
-            """Analysis of concept clarity in a scene."""
-            
-            concept_name: str = Field(
-                description="Name of the concept"
-            )
-            clarity_score: int = Field(
-                ge=1, le=10,
-                description="Clarity score (1=unclear, 10=perfectly clear)"
-            )
-            introduction_text: str = Field(
-                description="The specific text that introduces the concept"
-            )
-            exposition_method: str = Field(
-                description="How the concept is introduced (dialogue, narration, etc.)"
-            )
-            natural_integration: int = Field(
-                ge=1, le=10,
-                description="How naturally the concept is integrated (1=forced, 10=seamless)"
-            )
-            strengths: List[str] = Field(
-                default_factory=list,
-                description="Strengths of the exposition"
-            )
-            weaknesses: List[str] = Field(
-                default_factory=list,
-                description="Weaknesses of the exposition"
-            )
-            improvement_suggestions: List[str] = Field(
-                default_factory=list,
-                description="Suggestions for improvement"
-            )
-        
-        # Create a structured LLM that outputs a ConceptClarity
-        structured_llm = llm.with_structured_output(ConceptClarity)
-        
         # Use the structured LLM to analyze concept clarity
-        clarity_analysis = structured_llm.invoke(prompt)
+        clarity_analysis = _CONCEPT_CLARITY_LLM.invoke([SystemMessage(content=_SYSTEM_CONCEPT_CLARITY), HumanMessage(content=prompt)])
         
         # Convert Pydantic model to dictionary
-        return clarity_analysis.dict()
+        result = clarity_analysis.model_dump()
+        analysis_cache.set("concept_clarity", cache_key, clarity_analysis.model_dump_json())
+        
+        return result
     
-    except Exception as e:
-        print(f"Error analyzing concept clarity: {str(e)}")
+    except Exception:
+        logger.exception("Error analyzing concept clarity")
         return {
             "concept_name": concept_name,
             "clarity_score": 5,
@@ -376,6 +733,50 @@ def analyze_concept_clarity(scene_content: str, concept_name: str, language: str
             "improvement_suggestions": ["Error analyzing concept clarity"]
         }
 
+def _format_concepts_text(concepts_to_introduce: List[Dict[str, Any]]) -> str:
+    """
+    Format concepts as the bullet list used in exposition guidance prompts.
+    
+    Args:
+        concepts_to_introduce: List of concepts to introduce
+        
+    Returns:
+        One line per concept with its description, importance and approach
+    """
+    return "".join(
+        f"- {concept['name']}: {concept['description']} (Importance: {concept['importance']}, Approach: {concept['exposition_approach']})\n"
+        for concept in concepts_to_introduce
+    )
+
+def _exposition_guidance_messages(concepts_to_introduce: List[Dict[str, Any]], genre: str, tone: str,
+                                  language_name: str) -> List[Any]:
+    """
+    Build the messages for generating exposition guidance.
+    
+    Args:
+        concepts_to_introduce: List of concepts to introduce
+        genre: The genre of the story
+        tone: The tone of the story
+        language_name: The full name of the story language
+        
+    Returns:
+        The shared system message followed by the concept-specific user message
+    """
+    # Format concepts for the prompt
+    concepts_text = _format_concepts_text(concepts_to_introduce)
+    
+    # Prepare the prompt for generating exposition guidance
+    prompt = f"""
+    Generate specific exposition guidance for introducing these concepts in a {genre} story with a {tone} tone written in {language_name}:
+    
+    CONCEPTS TO INTRODUCE:
+    {concepts_text}
+    
+    Provide your guidance in {language_name}.
+    """
+    
+    return [SystemMessage(content=_SYSTEM_EXPOSITION_GUIDANCE), HumanMessage(content=prompt)]
+
 def generate_exposition_guidance(concepts_to_introduce: List[Dict[str, Any]], genre: str, tone: str,
                                language: str = DEFAULT_LANGUAGE) -> str:
     """
@@ -392,7 +793,7 @@ def generate_exposition_guidance(concepts_to_introduce: List[Dict[str, Any]], ge
     """
     # Validate language
     if language not in SUPPORTED_LANGUAGES:
-        print(f"Warning: Unsupported language '{language}'. Falling back to {DEFAULT_LANGUAGE}.")
+        logger.warning("Unsupported language '%s'. Falling back to %s.", language, DEFAULT_LANGUAGE)
         language = DEFAULT_LANGUAGE
     
     # Get the full language name
@@ -400,61 +801,33 @@ def generate_exposition_guidance(concepts_to_introduce: List[Dict[str, Any]], ge
     if not concepts_to_introduce:
         return ""
     
-    # Format concepts for the prompt
-    concepts_text = ""
-    for concept in concepts_to_introduce:
-        concepts_text += f"- {concept['name']}: {concept['description']} (Importance: {concept['importance']}, Approach: {concept['exposition_approach']})\n"
-    
-    # Prepare the prompt for generating exposition guidance
-    prompt = f"""
-    Generate specific exposition guidance for introducing these concepts in a {genre} story with a {tone} tone written in {language_name}:
-    
-    CONCEPTS TO INTRODUCE:
-    {concepts_text}
-    
-    Provide guidance on:
-    1. How to introduce these concepts naturally and clearly in {language_name}
-    2. How to avoid info-dumping
-    3. How to integrate the concepts into the narrative
-    4. How to ensure the reader understands the concepts' importance
-    5. Common exposition pitfalls to avoid in this genre
-    6. Language-specific exposition techniques for {language_name}
-    7. Cultural considerations for introducing concepts in {language_name} literature
+    # Format concepts for the fallback guidance
+    concepts_text = _format_concepts_text(concepts_to_introduce)
+    fallback_guidance = _FALLBACK_EXPOSITION_GUIDANCE.format(
+        language_name=language_name,
+        language_name_upper=language_name.upper(),
+        concepts_text=concepts_text
+    )
     
-    Format your response as concise, actionable guidelines that could be included in a scene writing prompt.
-    Focus on creating clear, engaging exposition appropriate for the genre, tone, and language.
-    Provide your guidance in {language_name}.
-    """
+    # The generic template is good enough for low-importance concepts, so skip the LLM
+    if all(concept["importance"] == "low" for concept in concepts_to_introduce):
+        return fallback_guidance
     
     try:
         # Generate the exposition guidance
-        response = llm.invoke([HumanMessage(content=prompt)]).content
+        response = llm.invoke(_exposition_guidance_messages(concepts_to_introduce, genre, tone, language_name))
         
         # Clean up the response
-        exposition_guidance = response.strip()
+        exposition_guidance = response.content.strip()
         
         return f"""
         EXPOSITION GUIDANCE:
         {exposition_guidance}
         """
     
-    except Exception as e:
-        print(f"Error generating exposition guidance: {str(e)}")
-        return f"""
-        EXPOSITION GUIDANCE FOR {language_name.upper()}:
-        1. Introduce these key concepts clearly in this scene:
-        {concepts_text}
-        
-        2. Guidelines for clear exposition in {language_name}:
-           - Introduce concepts organically through character interaction or observation
-           - Avoid info-dumping - break exposition into digestible pieces
-           - Show rather than tell when possible
-           - Use character questions or confusion to naturally explain concepts
-           - Ensure the reader understands the concept's importance to the story
-           - Consider cultural context and linguistic norms specific to {language_name}
-           - Use idiomatic expressions and natural speech patterns in {language_name}
-           - Adapt exposition techniques to match {language_name} literary traditions
-        """
+    except Exception:
+        logger.exception("Error generating exposition guidance")
+        return fallback_guidance
 
 def check_and_generate_exposition_guidance(state: StoryState) -> Dict:
     """
@@ -480,50 +853,28 @@ def check_and_generate_exposition_guidance(state: StoryState) -> Dict:
     
     concepts_to_introduce = concepts_result["concepts_to_introduce"]
     
-    # Generate exposition guidance
-    exposition_guidance = generate_exposition_guidance(concepts_to_introduce, genre, tone, language)
-    
-    # Add sensory checklists for each concept
-    sensory_checklists = {}
-    for concept in concepts_to_introduce:
-        sensory_checklists[concept["name"]] = generate_concept_sensory_checklist(concept, language)
+    # The exposition guidance and the sensory checklists are independent LLM requests,
+    # so run them concurrently; wall time becomes the slower of the two instead of the sum
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        guidance_future = executor.submit(generate_exposition_guidance, concepts_to_introduce, genre, tone, language)
+        checklists_future = executor.submit(generate_concept_sensory_checklists, concepts_to_introduce, language)
+        
+        # Generate exposition guidance
+        exposition_guidance = guidance_future.result()
+        
+        # Add sensory checklists for each concept
+        sensory_checklists = checklists_future.result()
     
     # Add sensory checklists to exposition guidance
     if sensory_checklists:
-        sensory_guidance = "\n\nSENSORY CHECKLISTS FOR KEY CONCEPTS:\n"
+        sensory_parts = ["\n\nSENSORY CHECKLISTS FOR KEY CONCEPTS:\n"]
         for concept_name, checklist in sensory_checklists.items():
-            sensory_guidance += f"\n{concept_name}:\n{checklist}\n"
+            sensory_parts.append(f"\n{concept_name}:\n{checklist}\n")
         
-        exposition_guidance += sensory_guidance
+        exposition_guidance += "".join(sensory_parts)
     
     # Add showing vs. telling guidance
-    showing_telling_guidance = """
-    SHOWING VS. TELLING FOR CONCEPT INTRODUCTION:
-    
-    Instead of explaining concepts directly, demonstrate them through:
-    
-    1. CHARACTER INTERACTIONS:
-       - Show characters using or encountering the concept
-       - Reveal information through character reactions
-       - Use dialogue that naturally incorporates the concept
-    
-    2. SENSORY EXPERIENCES:
-       - Describe how the concept looks, sounds, smells, feels, or tastes
-       - Show physical manifestations of abstract concepts
-       - Create vivid imagery that embodies the concept
-    
-    3. ENVIRONMENTAL CUES:
-       - Use the setting to reflect or embody the concept
-       - Show how the concept affects the environment
-       - Create atmosphere that reinforces the concept
-    
-    4. CONCRETE EXAMPLES:
-       - Show specific instances rather than general explanations
-       - Use representative examples that illustrate the concept
-       - Create symbolic objects or events that embody the concept
-    """
-    
-    exposition_guidance += showing_telling_guidance
+    exposition_guidance += _SHOWING_TELLING_GUIDANCE
     
     return {
         "concepts_to_introduce": concepts_to_introduce,
@@ -531,58 +882,90 @@ def check_and_generate_exposition_guidance(state: StoryState) -> Dict:
         "sensory_checklists": sensory_checklists
     }
 
-def convert_exposition_to_sensory(exposition_text: str) -> str:
+def _exposition_to_sensory_messages(exposition_text: str) -> List[Any]:
     """
-    Convert expository statements into sensory descriptions.
+    Build the messages for converting expository text into sensory descriptions.
     
     Args:
         exposition_text: The expository text to convert
         
     Returns:
-        Sensory descriptions that show rather than tell
+        The shared system message followed by the passage-specific user message
     """
     # Prepare the prompt for converting exposition to sensory descriptions
     prompt = f"""
     Convert this expository text into sensory descriptions that show rather than tell:
     
     {exposition_text}
+    """
     
-    Focus on:
-    - Visual details (what would a character SEE?)
-    - Sounds (what would a character HEAR?)
-    - Smells, tastes, and textures (what physical sensations are associated?)
-    - Character reactions and emotions (how do characters physically respond?)
-    - Environmental cues (how does the environment reflect the information?)
-    
-    EXAMPLES:
-    
-    TELLING: "The Sülfmeister were resentful of the Patrizier's power over the salt trade."
-    SHOWING: "Müller's knuckles whitened around his salt measure as the Patrizier's tax collector approached. The other Sülfmeister exchanged glances, their shoulders tensing beneath salt-crusted coats. No one spoke, but their silence carried the weight of generations of resentment."
-    
-    TELLING: "The Salzmal was an ancient salt tax that caused conflict between social classes."
-    SHOWING: "The iron seal of the Salzmal glinted on the collection box, its worn edges smoothed by centuries of reluctant tributes. When it appeared, conversations hushed and eyes darted to worn boots. A Sülfmeister spat on the ground, the gesture small but defiant, while the Patrizier's man adjusted his clean collar with manicured fingers."
-    
-    Return only the converted text with no explanations or comments.
+    return [SystemMessage(content=_SYSTEM_EXPOSITION_TO_SENSORY), HumanMessage(content=prompt)]
+
+def convert_exposition_to_sensory(exposition_text: str) -> str:
     """
+    Convert expository statements into sensory descriptions.
     
+    Args:
+        exposition_text: The expository text to convert
+        
+    Returns:
+        Sensory descriptions that show rather than tell
+    """
     try:
         # Generate the sensory descriptions
-        response = llm.invoke([HumanMessage(content=prompt)])
+        sensory_text = llm.invoke(_exposition_to_sensory_messages(exposition_text)).content.strip()
         
         # Check if we got a valid response
-        if response is None or response.content is None:
-            print("Error converting exposition to sensory: LLM returned None")
+        if not sensory_text:
+            logger.error("Error converting exposition to sensory: LLM returned no content")
             return exposition_text  # Return original text if conversion fails
         
-        # Clean up the response
-        sensory_text = response.content.strip()
-        
         return sensory_text
     
-    except Exception as e:
-        print(f"Error converting exposition to sensory: {str(e)}")
+    except Exception:
+        logger.exception("Error converting exposition to sensory")
         return exposition_text  # Return original text if conversion fails
 
+def convert_exposition_to_sensory_batch(passages: List[str]) -> List[str]:
+    """
+    Convert several expository passages into sensory descriptions at once.
+    
+    The requests share the same system message prefix and are sent together, so
+    providers with prompt-prefix caching can reuse the instructions across passages.
+    
+    Args:
+        passages: The expository passages to convert
+        
+    Returns:
+        Sensory descriptions in the order of the passages; a passage that fails to
+        convert is returned unchanged
+    """
+    if not passages:
+        return []
+    
+    try:
+        responses = llm.batch(
+            [_exposition_to_sensory_messages(passage) for passage in passages],
+            config={"max_concurrency": _MAX_PARALLEL_LLM_CALLS},
+            return_exceptions=True
+        )
+    except Exception:
+        logger.exception("Error converting exposition to sensory")
+        return list(passages)  # Return original texts if conversion fails
+    
+    sensory_texts = []
+    for passage, response in zip(passages, responses):
+        if isinstance(response, Exception):
+            logger.error("Error converting exposition to sensory: %s", response)
+            sensory_texts.append(passage)
+        elif response is None or not response.content or not response.content.strip():
+            logger.error("Error converting exposition to sensory: LLM returned no content")
+            sensory_texts.append(passage)
+        else:
+            sensory_texts.append(response.content.strip())
+    
+    return sensory_texts
+
 def identify_telling_passages(scene_content: str) -> List[str]:
     """
     Identify passages in a scene that tell rather than show.
@@ -593,49 +976,33 @@ def identify_telling_passages(scene_content: str) -> List[str]:
     Returns:
         A list of passages that tell rather than show
     """
+    cache_key = content_key(scene_content)
+    cached = analysis_cache.get("telling_passages", cache_key)
+    if cached is not None:
+        return TellingPassages.model_validate_json(cached).passages
+    
     # Prepare the prompt for identifying telling passages
     prompt = f"""
     Identify passages in this scene that "tell" rather than "show":
     
     {scene_content}
-    
-    Look for:
-    1. Direct statements about emotions rather than physical manifestations
-    2. Explanations of world elements rather than interactions with them
-    3. Abstract descriptions rather than concrete sensory details
-    4. Statements that explain character traits rather than demonstrating them
-    5. Exposition that could be converted to action, dialogue, or sensory experience
-    
-    For each passage, extract ONLY the exact text that should be converted to showing.
     """
     
     try:
-        # Define Pydantic model for structured output
-        from pydantic import BaseModel, Field
-        from typing import List
-        
-        class TellingPassages(BaseModel):
-            """Passages that tell rather than show."""
-            passages: List[str] = Field(
-                description="List of passages that tell rather than show"
-            )
-        
-        # Create a structured LLM that outputs TellingPassages
-        structured_llm = llm.with_structured_output(TellingPassages)
-        
         # Use the structured LLM to identify telling passages
-        telling_passages = structured_llm.invoke(prompt)
+        telling_passages = _TELLING_PASSAGES_LLM.invoke([SystemMessage(content=_SYSTEM_TELLING_PASSAGES), HumanMessage(content=prompt)])
         
         # Check if we got a valid response
         if telling_passages is None:
-            print("Error identifying telling passages: LLM returned None")
+            logger.error("Error identifying telling passages: LLM returned None")
             return []
         
         # Return the list of passages
+        analysis_cache.set("telling_passages", cache_key, telling_passages.model_dump_json())
         return telling_passages.passages
     
-    except Exception as e:
-        print(f"Error identifying telling passages: {str(e)}")
+    except Exception:
+        logger.exception("Error identifying telling passages")
         return []  # Return empty list if identification fails
 
 def analyze_showing_vs_telling(scene_content: str) -> Dict[str, Any]:
@@ -648,120 +1015,25 @@ def analyze_showing_vs_telling(scene_content: str) -> Dict[str, Any]:
     Returns:
         A dictionary with showing vs. telling analysis results
     """
+    cache_key = content_key(scene_content)
+    cached = analysis_cache.get("showing_telling", cache_key)
+    if cached is not None:
+        return ShowingTellingAnalysis.model_validate_json(cached).model_dump()
+    
     # Prepare the prompt for analyzing showing vs. telling
     prompt = f"""
     Analyze this scene for the balance of showing vs. telling:
     
     {scene_content}
-    
-    Evaluate:
-    1. How effectively does the scene use sensory details?
-    2. Are emotions shown through physical manifestations or just stated?
-    3. Are world elements experienced through character interaction or just explained?
-    4. Is character development demonstrated through actions or just described?
-    5. What is the overall ratio of showing to telling?
-    
-    Identify specific examples of:
-    - Effective showing (with excerpts)
-    - Instances of telling that could be improved (with excerpts)
-    - Missed opportunities for sensory details
     """
     
     try:
-        # Define Pydantic models for structured output
-        from pydantic import BaseModel, Field, field_validator
-        from typing import List
-        
-        class TellingInstance(BaseModel):
-            """An instance of telling rather than showing."""
-            text: str = Field(
-                description="The text that tells rather than shows"
-            )
-            issue: str = Field(
-                description="What type of telling issue this is"
-            )
-            improvement_suggestion: str = Field(
-                description="Suggestion for how to convert to showing"
-            )
-        
-        class ShowingInstance(BaseModel):
-            """An instance of effective showing."""
-            text: str = Field(
-                description="The text that effectively shows"
-            )
-            strength: str = Field(
-                description="What makes this an effective example of showing"
-            )
-        
-        class ShowingTellingAnalysis(BaseModel):
-                    """Analysis of showing vs. telling in a scene."""
-                    sensory_details_score: int = Field(
-                        ge=1, le=10,
-                        description="Effectiveness of sensory details (1=poor, 10=excellent)"
-                    )
-                    emotion_showing_score: int = Field(
-                        ge=1, le=10,
-                        description="How well emotions are shown rather than told"
-                    )
-                    world_element_showing_score: int = Field(
-                        ge=1, le=10,
-                        description="How well world elements are shown rather than explained"
-                    )
-                    character_development_showing_score: int = Field(
-                        ge=1, le=10,
-                        description="How well character development is shown rather than described"
-                    )
-                    overall_showing_ratio: int = Field(
-                        ge=1, le=10,
-                        description="Overall ratio of showing to telling (1=all telling, 10=all showing)"
-                    )
-                    telling_instances: List[TellingInstance] = Field(
-                        default_factory=list,
-                        description="Instances of telling that could be improved"
-                    )
-                    showing_instances: List[ShowingInstance] = Field(
-                        default_factory=list,
-                        description="Examples of effective showing"
-                    )
-                    missed_opportunities: List[str] = Field(
-                        default_factory=list,
-                        description="Missed opportunities for sensory details"
-                    )
-                    improvement_suggestions: List[str] = Field(
-                        default_factory=list,
-                        description="General suggestions for improving showing vs. telling"
-                    )
-                    
-                    # Custom validator to handle string inputs for list fields
-                    @classmethod
-                    def validate_list_fields(cls, v, field):
-                        """Handle cases where the LLM returns a string instead of a list."""
-                        if isinstance(v, str):
-                            # Try to parse the string as JSON
-                            try:
-                                import json
-                                parsed = json.loads(v)
-                                if isinstance(parsed, list):
-                                    return parsed
-                            except:
-                                pass
-                            # If parsing fails, return an empty list
-                            return []
-                        return v
-                    
-                    @field_validator('showing_instances', 'telling_instances', 'missed_opportunities', 'improvement_suggestions', mode='before')
-                    def validate_lists(cls, v, info):
-                        return cls.validate_list_fields(v, info.field_name)
-        
-        # Create a structured LLM that outputs a ShowingTellingAnalysis
-        structured_llm = llm.with_structured_output(ShowingTellingAnalysis)
-        
         # Use the structured LLM to analyze showing vs. telling
-        showing_telling_analysis = structured_llm.invoke(prompt)
+        showing_telling_analysis = _SHOWING_TELLING_LLM.invoke([SystemMessage(content=_SYSTEM_SHOWING_TELLING), HumanMessage(content=prompt)])
         
         # Check if we got a valid response
         if showing_telling_analysis is None:
-            print("Error analyzing showing vs. telling: LLM returned None")
+            logger.error("Error analyzing showing vs. telling: LLM returned None")
             return {
                 "sensory_details_score": 5,
                 "emotion_showing_score": 5,
@@ -775,13 +1047,17 @@ def analyze_showing_vs_telling(scene_content: str) -> Dict[str, Any]:
             }
         
         # Convert Pydantic model to dictionary
-        return showing_telling_analysis.dict()
+        result = showing_telling_analysis.model_dump()
+        analysis_cache.set("showing_telling", cache_key, showing_telling_analysis.model_dump_json())
+        
+        return result
     
     except Exception as e:
-        print(f"Error analyzing showing vs. telling: {str(e)}")
+        logger.exception("Error analyzing showing vs. telling")
         
         # Try to extract partial results if possible
-        if "showing_instances" in str(e) and "list_type" in str(e):
+        error_message = str(e)
+        if "showing_instances" in error_message and "list_type" in error_message:
             # This is the specific error we're handling
             try:
                 # Create a simpler prompt that focuses just on the overall scores
@@ -789,36 +1065,21 @@ def analyze_showing_vs_telling(scene_content: str) -> Dict[str, Any]:
                 Analyze this scene for the balance of showing vs. telling and provide numeric scores:
                 
                 {scene_content}
-                
-                Evaluate on a 1-10 scale:
-                - How effectively does the scene use sensory details?
-                - Are emotions shown through physical manifestations or just stated?
-                - Are world elements experienced through character interaction or just explained?
-                - Is character development demonstrated through actions or just described?
-                - What is the overall ratio of showing to telling?
                 """
                 
                 # Use a simpler model without the problematic fields
-                class SimpleShowingTellingAnalysis(BaseModel):
-                    sensory_details_score: int = Field(ge=1, le=10)
-                    emotion_showing_score: int = Field(ge=1, le=10)
-                    world_element_showing_score: int = Field(ge=1, le=10)
-                    character_development_showing_score: int = Field(ge=1, le=10)
-                    overall_showing_ratio: int = Field(ge=1, le=10)
-                
-                simple_llm = llm.with_structured_output(SimpleShowingTellingAnalysis)
-                simple_analysis = simple_llm.invoke(simple_prompt)
+                simple_analysis = _SIMPLE_SHOWING_TELLING_LLM.invoke([SystemMessage(content=_SYSTEM_SIMPLE_SHOWING_TELLING), HumanMessage(content=simple_prompt)])
                 
                 # Create a result with the scores but empty lists for the problematic fields
                 return {
-                    **simple_analysis.dict(),
+                    **simple_analysis.model_dump(),
                     "telling_instances": [],
                     "showing_instances": [],
                     "missed_opportunities": [],
                     "improvement_suggestions": ["Error processing detailed analysis, showing basic scores only"]
                 }
-            except Exception as inner_e:
-                print(f"Error in fallback analysis: {str(inner_e)}")
+            except Exception:
+                logger.exception("Error in fallback analysis")
                 # Fall back to default values if everything fails
                 return {
                     "sensory_details_score": 5,
@@ -858,7 +1119,7 @@ def generate_concept_sensory_checklist(concept: Dict[str, Any], language: str =
     """
     # Validate language
     if language not in SUPPORTED_LANGUAGES:
-        print(f"Warning: Unsupported language '{language}'. Falling back to {DEFAULT_LANGUAGE}.")
+        logger.warning("Unsupported language '%s'. Falling back to %s.", language, DEFAULT_LANGUAGE)
         language = DEFAULT_LANGUAGE
     
     # Get the full language name
@@ -871,47 +1132,111 @@ def generate_concept_sensory_checklist(concept: Dict[str, Any], language: str =
     CONCEPT: {concept['name']}
     DESCRIPTION: {concept['description']}
     
-    Create a checklist of sensory details that could be used to introduce this concept through showing rather than telling.
-    Include at least one item for each sensory category:
-    - Visual details
-    - Sounds
-    - Smells/tastes
-    - Textures/physical sensations
-    - Character reactions
-    - Cultural sensory associations in {language_name}-speaking cultures
-    
-    Format your response as a concise, actionable checklist.
     Provide your checklist in {language_name}.
     """
     
     try:
         # Generate the sensory checklist
-        response = llm.invoke([HumanMessage(content=prompt)])
+        response = llm.invoke([SystemMessage(content=_SYSTEM_SENSORY_CHECKLIST), HumanMessage(content=prompt)])
         
         # Check if we got a valid response
         if response is None or response.content is None:
-            print("Error generating concept sensory checklist: LLM returned None")
-            return f"""
-            Sensory Checklist for {concept['name']}:
-            - Visual: Show a physical manifestation of the concept
-            - Sound: Include sounds associated with the concept
-            - Smell/Taste: Add olfactory or gustatory details
-            - Touch: Describe textures or physical sensations
-            - Reaction: Show character physical/emotional reactions
-            """
+            logger.error("Error generating concept sensory checklist: LLM returned None")
+            return _FALLBACK_SENSORY_CHECKLIST.format(name=concept['name'])
         
         # Clean up the response
         sensory_checklist = response.content.strip()
         
         return sensory_checklist
     
-    except Exception as e:
-        print(f"Error generating concept sensory checklist: {str(e)}")
-        return f"""
-        Sensory Checklist for {concept['name']}:
-        - Visual: Show a physical manifestation of the concept
-        - Sound: Include sounds associated with the concept
-        - Smell/Taste: Add olfactory or gustatory details
-        - Touch: Describe textures or physical sensations
-        - Reaction: Show character physical/emotional reactions
-        """
\ No newline at end of file
+    except Exception:
+        logger.exception("Error generating concept sensory checklist")
+        return _FALLBACK_SENSORY_CHECKLIST.format(name=concept['name'])
+
+# Upper bound on concepts per batched request; very large batches make models drop items
+_CHECKLIST_BATCH_SIZE = 10
+
+# Upper bound on concurrent LLM requests issued from this module, to respect provider rate limits
+_MAX_PARALLEL_LLM_CALLS = 8
+
+def _generate_checklist_batch(batch: List[Dict[str, Any]], language: str) -> Dict[str, str]:
+    """
+    Generate sensory checklists for one batch of concepts with a single LLM call.
+    
+    Args:
+        batch: The concepts of this batch
+        language: The (validated) language of the story
+        
+    Returns:
+        A dictionary mapping concept names to sensory checklists
+    """
+    # Get the full language name
+    language_name = SUPPORTED_LANGUAGES[language]
+    
+    concepts_json = json.dumps(
+        [{"id": i, "name": concept["name"], "description": concept["description"]}
+         for i, concept in enumerate(batch)],
+        ensure_ascii=False, indent=2
+    )
+    
+    # Prepare the prompt for generating all checklists of the batch at once
+    prompt = f"""
+    Generate a sensory checklist for introducing each of these concepts in {language_name}:
+    
+    CONCEPTS:
+    {concepts_json}
+    
+    Provide your checklists in {language_name}.
+    """
+    
+    checklists_by_id = {}
+    try:
+        # Use the structured LLM to generate all checklists of the batch
+        checklist_batch = _CHECKLIST_BATCH_LLM.invoke([SystemMessage(content=_SYSTEM_SENSORY_CHECKLIST_BATCH), HumanMessage(content=prompt)])
+        
+        if checklist_batch is not None:
+            checklists_by_id = {item.id: item.checklist.strip() for item in checklist_batch.items
+                                if item.checklist and item.checklist.strip()}
+    
+    except Exception:
+        logger.exception("Error generating batched sensory checklists")
+    
+    # Fall back to individual requests for any concept the model dropped
+    sensory_checklists = {}
+    for i, concept in enumerate(batch):
+        checklist = checklists_by_id.get(i)
+        if checklist is None:
+            checklist = generate_concept_sensory_checklist(concept, language)
+        sensory_checklists[concept["name"]] = checklist
+    
+    return sensory_checklists
+
+def generate_concept_sensory_checklists(concepts: List[Dict[str, Any]],
+                                        language: str = DEFAULT_LANGUAGE) -> Dict[str, str]:
+    """
+    Generate sensory checklists for several key concepts with one LLM call per batch.
+    
+    Args:
+        concepts: The concepts to generate checklists for
+        language: The language of the story (default: from config)
+        
+    Returns:
+        A dictionary mapping concept names to sensory checklists
+    """
+    # Validate language
+    if language not in SUPPORTED_LANGUAGES:
+        logger.warning("Unsupported language '%s'. Falling back to %s.", language, DEFAULT_LANGUAGE)
+        language = DEFAULT_LANGUAGE
+    
+    batches = [concepts[start:start + _CHECKLIST_BATCH_SIZE]
+               for start in range(0, len(concepts), _CHECKLIST_BATCH_SIZE)]
+    if len(batches) <= 1:
+        return _generate_checklist_batch(batches[0], language) if batches else {}
+    
+    # Batches are independent, so their LLM round-trips can overlap
+    sensory_checklists = {}
+    with ThreadPoolExecutor(max_workers=min(len(batches), _MAX_PARALLEL_LLM_CALLS)) as executor:
+        for batch_checklists in executor.map(lambda batch: _generate_checklist_batch(batch, language), batches):
+            sensory_checklists.update(batch_checklists)
+    
+    return sensory_checklists
@@ -2,19 +2,79 @@
 StoryCraft Agent - Initialization nodes.
 """
 
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from storyteller_lib.config import llm, manage_memory_tool, search_memory_tool, MEMORY_NAMESPACE, DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES
 from storyteller_lib.models import StoryState
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.messages.modifier import RemoveMessage
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
 from storyteller_lib import track_progress
 
+# Progress messages sent by the initialization nodes
+_INIT_MSG_TEMPLATE = "I'll create a {tone} {genre} story{author_mention}{language_mention}{idea_mention} for you. Let me start planning the narrative..."
+_BRAINSTORM_MSG_TEMPLATE = "I've brainstormed several creative concepts for your {tone} {genre} story{idea_mention}. Now I'll develop a cohesive outline based on the most promising ideas."
+
+# Immutable initial values of the story state fields
+_INITIAL_STATE_DEFAULTS = {
+    "global_story": "",
+    "current_chapter": "",
+    "current_scene": "",
+    "completed": False
+}
+
+@lru_cache(maxsize=64)
+def _normalize_language(language: str) -> Tuple[str, str]:
+    """
+    Normalize a language to its supported key and display name.
+    
+    Args:
+        language: The language as given, in any case
+        
+    Returns:
+        The lowercase language key and its display name, falling back to the default
+        language if the language is not supported
+    """
+    language_key = language.lower()
+    if language_key not in SUPPORTED_LANGUAGES:
+        language_key = DEFAULT_LANGUAGE
+    return language_key, SUPPORTED_LANGUAGES[language_key]
+
+@lru_cache(maxsize=128)
+def _get_cached_author_style(author_key: str) -> Optional[str]:
+    """
+    Look up stored author style guidance, memoized per process.
+    
+    Call invalidate_author_style_cache() after storing new guidance.
+    
+    Args:
+        author_key: The memory key of the author style, e.g. "author_style_jane_austen"
+        
+    Returns:
+        The stored author style guidance, or None if there is none
+    """
+    # Use search_memory_tool to retrieve the author style
+    results = search_memory_tool.invoke({
+        "query": author_key
+    })
+    
+    # Extract the author style from the results
+    if results and len(results) > 0:
+        for item in results:
+            if hasattr(item, 'key') and item.key == author_key:
+                return item.value
+    
+    return None
+
+def invalidate_author_style_cache() -> None:
+    """Forget memoized author style lookups, e.g. after new guidance has been stored."""
+    _get_cached_author_style.cache_clear()
+
 @track_progress
 def initialize_state(state: StoryState) -> Dict:
     """Initialize the story state with user input."""
-    messages = state["messages"]
-    
     # Use the genre, tone, author, language, and initial idea values already passed in the state
     # If not provided, use defaults
     genre = state.get("genre") or "fantasy"
@@ -25,8 +85,7 @@ def initialize_state(state: StoryState) -> Dict:
     language = state.get("language") or DEFAULT_LANGUAGE
     
     # Validate language and default to English if not supported
-    if language.lower() not in SUPPORTED_LANGUAGES:
-        language = DEFAULT_LANGUAGE
+    language, language_name = _normalize_language(language)
     
     # Get initial idea elements from state or extract them if needed
     idea_elements = state.get("initial_idea_elements", {})
@@ -72,61 +131,49 @@ def initialize_state(state: StoryState) -> Dict:
     if author and not author_style_guidance:
         # See if we have cached guidance
         try:
-            # Use search_memory_tool to retrieve the author style
-            results = search_memory_tool.invoke({
-                "query": f"author_style_{author.lower().replace(' ', '_')}"
-            })
-            
-            # Extract the author style from the results
-            author_style_object = None
-            if results and len(results) > 0:
-                for item in results:
-                    if hasattr(item, 'key') and item.key == f"author_style_{author.lower().replace(' ', '_')}":
-                        author_style_object = {"key": item.key, "value": item.value}
-                        break
-            
-            if author_style_object and "value" in author_style_object:
-                author_style_guidance = author_style_object["value"]
+            cached_author_style = _get_cached_author_style(f"author_style_{author.lower().replace(' ', '_')}")
+            if cached_author_style is not None:
+                author_style_guidance = cached_author_style
         except Exception:
             # If error, we'll generate it later
             pass
     
     # Prepare response message
-    author_mention = f" in the style of {author}" if author else ""
-    idea_mention = f" implementing the idea: '{initial_idea}'" if initial_idea else ""
-    language_mention = f" in {SUPPORTED_LANGUAGES[language.lower()]}" if language.lower() != DEFAULT_LANGUAGE else ""
-    response_message = f"I'll create a {tone} {genre} story{author_mention}{language_mention}{idea_mention} for you. Let me start planning the narrative..."
-    
-    # Get existing message IDs to delete
-    message_ids = [msg.id for msg in state.get("messages", [])]
+    response_message = _INIT_MSG_TEMPLATE.format(
+        tone=tone,
+        genre=genre,
+        author_mention=f" in the style of {author}" if author else "",
+        language_mention=f" in {language_name}" if language != DEFAULT_LANGUAGE else "",
+        idea_mention=f" implementing the idea: '{initial_idea}'" if initial_idea else ""
+    )
     
     # Initialize language-specific naming and cultural elements if not English
-    if language.lower() != DEFAULT_LANGUAGE:
+    if language != DEFAULT_LANGUAGE:
         language_elements_prompt = f"""
-        Create a comprehensive guide for generating story elements in {SUPPORTED_LANGUAGES[language.lower()]} that will ensure consistency throughout the story.
+        Create a comprehensive guide for generating story elements in {language_name} that will ensure consistency throughout the story.
         
         Provide the following:
         
         1. NAMING CONVENTIONS:
-           - Common first names for male characters in {SUPPORTED_LANGUAGES[language.lower()]}-speaking cultures
-           - Common first names for female characters in {SUPPORTED_LANGUAGES[language.lower()]}-speaking cultures
-           - Common family/last names in {SUPPORTED_LANGUAGES[language.lower()]}-speaking cultures
+           - Common first names for male characters in {language_name}-speaking cultures
+           - Common first names for female characters in {language_name}-speaking cultures
+           - Common family/last names in {language_name}-speaking cultures
            - Naming patterns or traditions (e.g., patronymics, compound names)
            
         2. PLACE NAMES:
-           - Types of place names common in {SUPPORTED_LANGUAGES[language.lower()]}-speaking regions
+           - Types of place names common in {language_name}-speaking regions
            - Common prefixes/suffixes for cities, towns, villages
            - Geographical feature naming patterns (mountains, rivers, forests)
            
         3. CULTURAL REFERENCES:
-           - Common idioms and expressions in {SUPPORTED_LANGUAGES[language.lower()]}
-           - Cultural traditions and customs specific to {SUPPORTED_LANGUAGES[language.lower()]}-speaking regions
-           - Historical references that would be familiar to {SUPPORTED_LANGUAGES[language.lower()]} speakers
+           - Common idioms and expressions in {language_name}
+           - Cultural traditions and customs specific to {language_name}-speaking regions
+           - Historical references that would be familiar to {language_name} speakers
            
         4. NARRATIVE ELEMENTS:
-           - Storytelling traditions in {SUPPORTED_LANGUAGES[language.lower()]} literature
-           - Common literary devices or techniques in {SUPPORTED_LANGUAGES[language.lower()]} writing
-           - Dialogue patterns or speech conventions in {SUPPORTED_LANGUAGES[language.lower()]}
+           - Storytelling traditions in {language_name} literature
+           - Common literary devices or techniques in {language_name} writing
+           - Dialogue patterns or speech conventions in {language_name}
            
         Format your response as a structured JSON object with these categories as keys.
         """
@@ -142,7 +189,7 @@ def initialize_state(state: StoryState) -> Dict:
             # Store language elements in memory for reference throughout story generation
             manage_memory_tool.invoke({
                 "action": "create",
-                "key": f"language_elements_{language.lower()}",
+                "key": f"language_elements_{language}",
                 "value": language_elements,
                 "namespace": MEMORY_NAMESPACE
             })
@@ -151,21 +198,21 @@ def initialize_state(state: StoryState) -> Dict:
             language_consistency_instruction = f"""
             CRITICAL LANGUAGE CONSISTENCY INSTRUCTION:
             
-            This story MUST be written ENTIRELY in {SUPPORTED_LANGUAGES[language.lower()]}.
-            ALL content - including outlines, character descriptions, scene elements, reflections, and revisions - must be in {SUPPORTED_LANGUAGES[language.lower()]}.
+            This story MUST be written ENTIRELY in {language_name}.
+            ALL content - including outlines, character descriptions, scene elements, reflections, and revisions - must be in {language_name}.
             DO NOT switch to any other language at ANY point in the story generation process.
             
-            When writing in {SUPPORTED_LANGUAGES[language.lower()]}, ensure that:
-            1. ALL text is in {SUPPORTED_LANGUAGES[language.lower()]} without ANY English phrases or words
-            2. Character names must be authentic {SUPPORTED_LANGUAGES[language.lower()]} names
-            3. Place names must follow {SUPPORTED_LANGUAGES[language.lower()]} naming conventions
-            4. Cultural references must be appropriate for {SUPPORTED_LANGUAGES[language.lower()]}-speaking audiences
-            5. Dialogue must use expressions and idioms natural to {SUPPORTED_LANGUAGES[language.lower()]}
-            6. ALL planning, outlining, and internal notes are also in {SUPPORTED_LANGUAGES[language.lower()]}
+            When writing in {language_name}, ensure that:
+            1. ALL text is in {language_name} without ANY English phrases or words
+            2. Character names must be authentic {language_name} names
+            3. Place names must follow {language_name} naming conventions
+            4. Cultural references must be appropriate for {language_name}-speaking audiences
+            5. Dialogue must use expressions and idioms natural to {language_name}
+            6. ALL planning, outlining, and internal notes are also in {language_name}
             
-            CRITICAL: Maintain {SUPPORTED_LANGUAGES[language.lower()]} throughout ALL parts of the story and ALL stages of the generation process without ANY exceptions.
+            CRITICAL: Maintain {language_name} throughout ALL parts of the story and ALL stages of the generation process without ANY exceptions.
             
-            REMINDER: Even if you are analyzing, planning, or reflecting on the story, you MUST do so in {SUPPORTED_LANGUAGES[language.lower()]}.
+            REMINDER: Even if you are analyzing, planning, or reflecting on the story, you MUST do so in {language_name}.
             """
             
             manage_memory_tool.invoke({
@@ -180,6 +227,7 @@ def initialize_state(state: StoryState) -> Dict:
     
     # Initialize the state
     result_state = {
+        **_INITIAL_STATE_DEFAULTS,
         "genre": genre,
         "tone": tone,
         "author": author,
@@ -187,15 +235,13 @@ def initialize_state(state: StoryState) -> Dict:
         "initial_idea_elements": idea_elements,  # Add structured idea elements
         "author_style_guidance": author_style_guidance,
         "language": language,
-        "global_story": "",
+        # Mutable containers are allocated per run so no state shares them
         "chapters": {},
         "characters": {},
         "revelations": {"reader": [], "characters": []},
-        "current_chapter": "",
-        "current_scene": "",
-        "completed": False,
         "messages": [
-            *[RemoveMessage(id=msg_id) for msg_id in message_ids],
+            # Clear all previous messages with a single removal sentinel
+            RemoveMessage(id=REMOVE_ALL_MESSAGES),
             AIMessage(content=response_message)
         ]
     }
@@ -263,7 +309,7 @@ def brainstorm_story_concepts(state: StoryState) -> Dict:
         initial_idea_elements = parse_initial_idea(initial_idea)
     
     author_style_guidance = state["author_style_guidance"]
-    language = state.get("language", DEFAULT_LANGUAGE)
+    language, language_name = _normalize_language(state.get("language", DEFAULT_LANGUAGE))
     
     # Generate enhanced context based on genre, tone, language, and initial idea
     
@@ -310,8 +356,8 @@ def brainstorm_story_concepts(state: StoryState) -> Dict:
         print(f"[STORYTELLER] Story will only use genre '{genre}' and tone '{tone}' as guidance, which may result in generic output")
     
     language_context = ""
-    if language.lower() != DEFAULT_LANGUAGE:
-        language_context = f"\nThe story should be written in {SUPPORTED_LANGUAGES[language.lower()]} with character names, places, and cultural references appropriate for {SUPPORTED_LANGUAGES[language.lower()]}-speaking audiences."
+    if language != DEFAULT_LANGUAGE:
+        language_context = f"\nThe story should be written in {language_name} with character names, places, and cultural references appropriate for {language_name}-speaking audiences."
     
     context = f"""
     We're creating a {tone} {genre} story that follows the hero's journey structure.
@@ -392,50 +438,32 @@ def brainstorm_story_concepts(state: StoryState) -> Dict:
             "namespace": MEMORY_NAMESPACE
         })
     
-    # Brainstorm different high-level story concepts
-    brainstorm_results = creative_brainstorm(
-        topic="Story Concept",
-        genre=genre,
-        tone=tone,
-        context=context,
-        author=author,
-        author_style_guidance=author_style_guidance,
-        language=language,
-        num_ideas=5,
-        evaluation_criteria=custom_evaluation_criteria,
-        constraints=constraints,
-        strict_adherence=True
-    )
-    
-    # Brainstorm unique world-building elements
-    world_building_results = creative_brainstorm(
-        topic="World Building Elements",
-        genre=genre,
-        tone=tone,
-        context=context,
-        author=author,
-        author_style_guidance=author_style_guidance,
-        language=language,
-        num_ideas=4,
-        evaluation_criteria=custom_evaluation_criteria,
-        constraints=constraints,
-        strict_adherence=True
-    )
-    
-    # Brainstorm central conflicts
-    conflict_results = creative_brainstorm(
-        topic="Central Conflict",
-        genre=genre,
-        tone=tone,
-        context=context,
-        author=author,
-        author_style_guidance=author_style_guidance,
-        language=language,
-        num_ideas=3,
-        evaluation_criteria=custom_evaluation_criteria,
-        constraints=constraints,
-        strict_adherence=True
-    )
+    # The three brainstorms are independent LLM requests, so run them concurrently;
+    # wall time becomes the slowest of the three instead of their sum
+    brainstorm_kwargs = {
+        "genre": genre,
+        "tone": tone,
+        "context": context,
+        "author": author,
+        "author_style_guidance": author_style_guidance,
+        "language": language,
+        "evaluation_criteria": custom_evaluation_criteria,
+        "constraints": constraints,
+        "strict_adherence": True
+    }
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Brainstorm different high-level story concepts
+        brainstorm_future = executor.submit(creative_brainstorm, topic="Story Concept", num_ideas=5, **brainstorm_kwargs)
+        
+        # Brainstorm unique world-building elements
+        world_building_future = executor.submit(creative_brainstorm, topic="World Building Elements", num_ideas=4, **brainstorm_kwargs)
+        
+        # Brainstorm central conflicts
+        conflict_future = executor.submit(creative_brainstorm, topic="Central Conflict", num_ideas=3, **brainstorm_kwargs)
+        
+        brainstorm_results = brainstorm_future.result()
+        world_building_results = world_building_future.result()
+        conflict_results = conflict_future.result()
     
     # Validate that the brainstormed ideas adhere to the initial idea
     if initial_idea:
@@ -483,18 +511,18 @@ def brainstorm_story_concepts(state: StoryState) -> Dict:
         creative_elements["initial_idea_elements"] = initial_idea_elements
     
     # Create messages to add and remove
-    idea_mention = f" based on your idea" if initial_idea else ""
-    
-    new_msg = AIMessage(content=f"I've brainstormed several creative concepts for your {tone} {genre} story{idea_mention}. Now I'll develop a cohesive outline based on the most promising ideas.")
-    
-    # Get existing message IDs to delete
-    message_ids = [msg.id for msg in state.get("messages", [])]
+    new_msg = AIMessage(content=_BRAINSTORM_MSG_TEMPLATE.format(
+        tone=tone,
+        genre=genre,
+        idea_mention=" based on your idea" if initial_idea else ""
+    ))
     
     # Update state with brainstormed ideas
     return {
         "creative_elements": creative_elements,
         "messages": [
-            *[RemoveMessage(id=msg_id) for msg_id in message_ids],
+            # Clear all previous messages with a single removal sentinel
+            RemoveMessage(id=REMOVE_ALL_MESSAGES),
             new_msg
         ]
     }
\ No newline at end of file
@@ -269,7 +269,7 @@ def update_concept_introduction_statuses(state: StoryState) -> Dict:
     Returns:
         Updates to the state
     """
-    from storyteller_lib.exposition import analyze_concept_clarity, update_concept_introduction_status
+    from storyteller_lib.exposition import analyze_concept_clarity, update_concept_introductions
     
     # Get the concepts that were supposed to be introduced
     concepts_to_introduce = state.get("concepts_to_introduce", [])
@@ -284,23 +284,26 @@ def update_concept_introduction_statuses(state: StoryState) -> Dict:
     scene_content = chapters[current_chapter]["scenes"][current_scene]["content"]
     
     # Check each concept for introduction
-    concept_updates = {}
+    clarity_analyses = {}
     for concept in concepts_to_introduce:
         concept_name = concept["name"]
         
         # Analyze how clearly the concept was introduced
         clarity_analysis = analyze_concept_clarity(scene_content, concept_name)
         
-        # If the concept was introduced with sufficient clarity, update its status
+        # Only concepts introduced with sufficient clarity get their status updated
         if clarity_analysis["clarity_score"] >= 6:
-            update_result = update_concept_introduction_status(state, concept_name)
-            
-            # Store the clarity analysis
-            if update_result:
-                concept_updates[concept_name] = {
-                    "introduced": True,
-                    "clarity_analysis": clarity_analysis
-                }
+            clarity_analyses[concept_name] = clarity_analysis
+    
+    # Update the statuses of all introduced concepts at once
+    concept_updates = {}
+    if clarity_analyses and update_concept_introductions(state, list(clarity_analyses)):
+        # Store the clarity analyses
+        for concept_name, clarity_analysis in clarity_analyses.items():
+            concept_updates[concept_name] = {
+                "introduced": True,
+                "clarity_analysis": clarity_analysis
+            }
     
     return {
         "concept_introductions": concept_updates
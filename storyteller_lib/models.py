@@ -16,28 +16,26 @@ ChapterStateDict = Dict[str, Dict[str, Union[str, Dict]]]
 CharacterProfileDict = Dict[str, Dict[str, Union[str, List[str], Dict]]]
 WorldElementsDict = Dict[str, Dict[str, Union[str, List[str], Dict]]]
 
-def merge_lists(existing: List[Any], new: List[Any]) -> List[Any]:
-    """Merge two lists, appending new values to existing list."""
-    if not existing:
-        return new
-    if not new:
-        return existing
-    return existing + new
+# Most graph steps leave a field untouched and send back the existing value or nothing.
+# Every reducer therefore returns `existing` unchanged when the update is empty or is
+# `existing` itself, and copies the update when there is nothing to merge it into.
 
-def merge_dicts(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
-    """Merge two dictionaries, with values from new dict taking precedence."""
-    result = existing.copy()
-    for key, value in new.items():
-        result[key] = value
-    return result
+def _coerce_relationships(relationships: Any) -> Dict[str, str]:
+    """Convert a character's relationships to a dict, accepting the list-of-dicts form LLMs sometimes return."""
+    if isinstance(relationships, dict):
+        return relationships
+    if isinstance(relationships, list):
+        return {item.get("character", f"char_{i}"): item.get("relationship", "")
+                for i, item in enumerate(relationships) if isinstance(item, dict)}
+    return {}
 
 def merge_characters(existing: CharacterProfileDict, new: CharacterProfileDict) -> CharacterProfileDict:
     """Deep merge character profiles to properly handle lists and nested content."""
-    # Handle the case where existing or new is None
-    if existing is None:
-        return new if new is not None else {}
-    if new is None:
+    if new is existing or not new:
         return existing
+    if not existing:
+        # Drop None entries, as the full merge below does
+        return {char_id: char_data for char_id, char_data in new.items() if char_data is not None}
     
     result = existing.copy()
     for char_id, char_data in new.items():
@@ -46,8 +44,9 @@ def merge_characters(existing: CharacterProfileDict, new: CharacterProfileDict)
             continue
             
         if char_id in result:
-            # If character exists, update fields intelligently
-            result_char = result[char_id].copy()
+            # If character exists, collect the updated fields and merge them in one step
+            result_char = result[char_id]
+            updates = {}
             
             # Special handling for list fields that should be appended
             for list_field in ["evolution", "known_facts", "secret_facts", "revealed_facts"]:
@@ -56,58 +55,25 @@ def merge_characters(existing: CharacterProfileDict, new: CharacterProfileDict)
                     # Only process if the field has a value (not empty)
                     if char_data[list_field]:
                         if list_field in result_char and result_char[list_field] is not None:
-                            result_char[list_field] = result_char[list_field] + char_data[list_field]
+                            updates[list_field] = result_char[list_field] + char_data[list_field]
                         else:
-                            result_char[list_field] = char_data[list_field]
+                            updates[list_field] = char_data[list_field]
             
             # Special handling for relationships dict
             if "relationships" in char_data and char_data["relationships"] is not None:
-                if "relationships" in result_char and result_char["relationships"] is not None:
-                    # Check if both are dictionaries before attempting to merge
-                    if isinstance(result_char["relationships"], dict) and isinstance(char_data["relationships"], dict):
-                        result_char["relationships"] = {**result_char["relationships"], **char_data["relationships"]}
-                    elif isinstance(char_data["relationships"], dict):
-                        # If only char_data has a dict, use it
-                        result_char["relationships"] = char_data["relationships"]
-                    elif isinstance(result_char["relationships"], dict):
-                        # If only result_char has a dict, keep it
-                        pass
-                    else:
-                        # If neither is a dict, convert to dict if possible or create empty dict
-                        try:
-                            # If it's a list of key-value pairs, convert to dict
-                            if isinstance(char_data["relationships"], list) and all(isinstance(item, dict) for item in char_data["relationships"]):
-                                result_char["relationships"] = {item.get("character", f"char_{i}"): item.get("relationship", "")
-                                                              for i, item in enumerate(char_data["relationships"])}
-                            else:
-                                # Default to empty dict if conversion not possible
-                                result_char["relationships"] = {}
-                        except Exception:
-                            # Fallback to empty dict
-                            result_char["relationships"] = {}
-                else:
-                    # Ensure relationships is a dict before assigning
-                    if isinstance(char_data["relationships"], dict):
-                        result_char["relationships"] = char_data["relationships"]
-                    elif isinstance(char_data["relationships"], list):
-                        # Try to convert list to dict if possible
-                        try:
-                            if all(isinstance(item, dict) for item in char_data["relationships"]):
-                                result_char["relationships"] = {item.get("character", f"char_{i}"): item.get("relationship", "")
-                                                              for i, item in enumerate(char_data["relationships"])}
-                            else:
-                                result_char["relationships"] = {}
-                        except Exception:
-                            result_char["relationships"] = {}
-                    else:
-                        result_char["relationships"] = {}
+                updates["relationships"] = {
+                    **_coerce_relationships(result_char.get("relationships")),
+                    **_coerce_relationships(char_data["relationships"])
+                }
             
             # Update other fields
             for field in ["name", "role", "backstory"]:
                 if field in char_data and char_data[field]:
-                    result_char[field] = char_data[field]
+                    updates[field] = char_data[field]
             
-            result[char_id] = result_char
+            # Only build a new entry if something actually changed
+            if updates:
+                result[char_id] = {**result_char, **updates}
         else:
             # New character, just add it
             result[char_id] = char_data
@@ -116,34 +82,42 @@ def merge_characters(existing: CharacterProfileDict, new: CharacterProfileDict)
 
 def merge_scenes(existing: SceneStateDict, new: SceneStateDict) -> SceneStateDict:
     """Merge scene dictionaries, handling nested content properly."""
+    if new is existing or not new:
+        return existing
+    if not existing:
+        return dict(new)
+    
     result = existing.copy()
     for scene_id, scene_data in new.items():
         if scene_id in result:
-            # Update existing scene
-            result_scene = result[scene_id].copy()
+            # Update existing scene, collecting the updated fields and merging them in one step
+            result_scene = result[scene_id]
+            updates = {}
             
             # Content should replace if provided
             if "content" in scene_data and scene_data["content"]:
-                result_scene["content"] = scene_data["content"]
+                updates["content"] = scene_data["content"]
                 
             # Structured reflection should always replace if provided
             if "structured_reflection" in scene_data and scene_data["structured_reflection"]:
-                result_scene["structured_reflection"] = scene_data["structured_reflection"]
+                updates["structured_reflection"] = scene_data["structured_reflection"]
                 
             # Reflection notes might need to append or replace depending on context
             if "reflection_notes" in scene_data:
                 # If reflection notes indicate scene was revised, we want to completely replace
                 if (len(scene_data["reflection_notes"]) == 1 and
                     scene_data["reflection_notes"][0] == "Scene has been revised"):
-                    result_scene["reflection_notes"] = scene_data["reflection_notes"]
+                    updates["reflection_notes"] = scene_data["reflection_notes"]
                 # Otherwise append
                 elif scene_data["reflection_notes"]:
                     if "reflection_notes" in result_scene:
-                        result_scene["reflection_notes"] = result_scene["reflection_notes"] + scene_data["reflection_notes"]
+                        updates["reflection_notes"] = result_scene["reflection_notes"] + scene_data["reflection_notes"]
                     else:
-                        result_scene["reflection_notes"] = scene_data["reflection_notes"]
+                        updates["reflection_notes"] = scene_data["reflection_notes"]
                         
-            result[scene_id] = result_scene
+            # Only build a new entry if something actually changed
+            if updates:
+                result[scene_id] = {**result_scene, **updates}
         else:
             # New scene, just add it
             result[scene_id] = scene_data
@@ -152,30 +126,38 @@ def merge_scenes(existing: SceneStateDict, new: SceneStateDict) -> SceneStateDic
 
 def merge_chapters(existing: ChapterStateDict, new: ChapterStateDict) -> ChapterStateDict:
     """Merge chapter dictionaries with special handling for nested scenes."""
+    if new is existing or not new:
+        return existing
+    if not existing:
+        return dict(new)
+    
     result = existing.copy()
     for chapter_id, chapter_data in new.items():
         if chapter_id in result:
-            # Update existing chapter
-            result_chapter = result[chapter_id].copy()
+            # Update existing chapter, collecting the updated fields and merging them in one step
+            result_chapter = result[chapter_id]
+            updates = {}
             
             # Handle scenes separately with deep merge
             if "scenes" in chapter_data:
                 scenes = result_chapter.get("scenes", {})
-                result_chapter["scenes"] = merge_scenes(scenes, chapter_data["scenes"])
+                updates["scenes"] = merge_scenes(scenes, chapter_data["scenes"])
                 
             # Handle reflection notes
             if "reflection_notes" in chapter_data and chapter_data["reflection_notes"]:
                 if "reflection_notes" in result_chapter:
-                    result_chapter["reflection_notes"] = result_chapter["reflection_notes"] + chapter_data["reflection_notes"]
+                    updates["reflection_notes"] = result_chapter["reflection_notes"] + chapter_data["reflection_notes"]
                 else:
-                    result_chapter["reflection_notes"] = chapter_data["reflection_notes"]
+                    updates["reflection_notes"] = chapter_data["reflection_notes"]
                     
             # Update other fields
             for field in ["title", "outline"]:
                 if field in chapter_data and chapter_data[field]:
-                    result_chapter[field] = chapter_data[field]
+                    updates[field] = chapter_data[field]
                     
-            result[chapter_id] = result_chapter
+            # Only build a new entry if something actually changed
+            if updates:
+                result[chapter_id] = {**result_chapter, **updates}
         else:
             # New chapter, just add it
             result[chapter_id] = chapter_data
@@ -184,10 +166,15 @@ def merge_chapters(existing: ChapterStateDict, new: ChapterStateDict) -> Chapter
 
 def merge_revelations(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
     """Merge revelation dictionaries, with special handling for continuity_issues."""
+    # An empty existing side still goes through the merge so that continuity issues are
+    # reduced to one per chapter
+    if new is existing or not new:
+        return existing
+    
     result = existing.copy()
     
-    # If there's no update or no continuity_issues in the update, just use standard merging
-    if not new or "continuity_issues" not in new:
+    # If there are no continuity_issues in the update, just use standard merging
+    if "continuity_issues" not in new:
         for key, values in new.items():
             if key in result:
                 # For normal lists, just append
@@ -207,34 +194,29 @@ def merge_revelations(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str
     # Create a dict to track the best issue for each chapter
     best_issues_by_chapter = {}
     
-    # Process all old issues
-    for issue in old_issues:
-        chapter = issue.get("after_chapter")
-        if not chapter:
-            continue
+    # Process old issues first, then new ones (which take precedence over old ones)
+    for issues, is_new in ((old_issues, False), (new_issues, True)):
+        for issue in issues:
+            chapter = issue.get("after_chapter")
+            if not chapter:
+                continue
             
-        # Only add if we don't have this chapter yet, or if this one is resolved and the current one isn't
-        if chapter not in best_issues_by_chapter:
-            best_issues_by_chapter[chapter] = issue
-        elif (issue.get("resolution_status") == "completed" and 
-              best_issues_by_chapter[chapter].get("resolution_status") != "completed"):
-            # Replace with resolved issue
-            best_issues_by_chapter[chapter] = issue
-    
-    # Process all new issues (these take precedence over old ones)
-    for issue in new_issues:
-        chapter = issue.get("after_chapter")
-        if not chapter:
-            continue
+            current = best_issues_by_chapter.get(chapter)
+            if current is None:
+                best_issues_by_chapter[chapter] = issue
+                continue
             
-        # New issues always replace old ones for the same chapter
-        # Unless we have a resolved one and this new one isn't resolved
-        if chapter not in best_issues_by_chapter:
-            best_issues_by_chapter[chapter] = issue
-        elif (issue.get("resolution_status") == "completed" or 
-              best_issues_by_chapter[chapter].get("resolution_status") != "completed"):
-            # Replace if the new issue is resolved OR if the current best isn't resolved
-            best_issues_by_chapter[chapter] = issue
+            completed = issue.get("resolution_status") == "completed"
+            current_completed = current.get("resolution_status") == "completed"
+            if is_new:
+                # New issues replace old ones for the same chapter, unless we have a
+                # resolved one and this new one isn't resolved
+                replace = completed or not current_completed
+            else:
+                # Among old issues, only a resolved one replaces an unresolved one
+                replace = completed and not current_completed
+            if replace:
+                best_issues_by_chapter[chapter] = issue
     
     # Create the final list of issues, one per chapter
     final_issues = list(best_issues_by_chapter.values())
@@ -243,18 +225,26 @@ def merge_revelations(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str
     result["continuity_issues"] = final_issues
     
     # Update any other fields from the new revelations update
-    for key, value in new.items():
-        if key != "continuity_issues":
-            result[key] = value
+    for key in new.keys() - {"continuity_issues"}:
+        result[key] = new[key]
             
     return result
 def merge_creative_elements(existing: Dict[str, Dict], new: Dict[str, Dict]) -> Dict[str, Dict]:
     """Merge creative elements dictionaries."""
+    if new is existing or not new:
+        return existing
+    if not existing:
+        return dict(new)
+    
     result = existing.copy()
     for key, value in new.items():
         result[key] = value  # Simply replace since these are typically not incrementally updated
     return result
 
+def _history_entry_key(entry: Dict[str, Any]) -> tuple:
+    """Return the key identifying a plot thread development history entry."""
+    return (entry.get("chapter"), entry.get("scene"), entry.get("development"))
+
 def merge_plot_threads(existing: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """
     Merge plot thread dictionaries, preserving thread history and development.
@@ -266,12 +256,17 @@ def merge_plot_threads(existing: Dict[str, Dict[str, Any]], new: Dict[str, Dict[
     Returns:
         The merged plot threads dictionary
     """
+    if new is existing or not new:
+        return existing
+    if not existing:
+        return dict(new)
+    
     result = existing.copy()
     
     for thread_name, thread_data in new.items():
         if thread_name in result:
-            # Update existing thread
-            existing_thread = result[thread_name]
+            # Update a copy of the existing thread so the previous state is left untouched
+            existing_thread = dict(result[thread_name])
             
             # Update status if it's changed
             if thread_data.get("status") != existing_thread.get("status"):
@@ -284,21 +279,15 @@ def merge_plot_threads(existing: Dict[str, Dict[str, Any]], new: Dict[str, Dict[
             
             # Append new development history entries
             if "development_history" in thread_data and thread_data["development_history"]:
-                existing_history = existing_thread.get("development_history", [])
-                new_history = thread_data["development_history"]
-                
-                # Only add entries that don't already exist
-                existing_entries = {
-                    f"{entry.get('chapter')}_{entry.get('scene')}_{entry.get('development')}"
-                    for entry in existing_history
-                }
-                
-                for entry in new_history:
-                    entry_key = f"{entry.get('chapter')}_{entry.get('scene')}_{entry.get('development')}"
-                    if entry_key not in existing_entries:
-                        existing_history.append(entry)
+                # Only add entries that don't already exist; the dict keeps the first
+                # occurrence of each entry in insertion order
+                combined_history = {}
+                for entry in existing_thread.get("development_history", []):
+                    combined_history.setdefault(_history_entry_key(entry), entry)
+                for entry in thread_data["development_history"]:
+                    combined_history.setdefault(_history_entry_key(entry), entry)
                 
-                existing_thread["development_history"] = existing_history
+                existing_thread["development_history"] = list(combined_history.values())
             
             # Update the thread in the result
             result[thread_name] = existing_thread
@@ -308,6 +297,14 @@ def merge_plot_threads(existing: Dict[str, Dict[str, Any]], new: Dict[str, Dict[
     
     return result
 
+def _dedup_key(item: Any) -> Any:
+    """Return a hashable key for de-duplicating list items, using repr only for unhashable items."""
+    try:
+        hash(item)
+    except TypeError:
+        return repr(item)
+    return item
+
 def merge_world_elements(existing: WorldElementsDict, new: WorldElementsDict) -> WorldElementsDict:
     """
     Merge worldbuilding elements dictionaries with intelligent handling of nested structures.
@@ -322,10 +319,18 @@ def merge_world_elements(existing: WorldElementsDict, new: WorldElementsDict) ->
     Returns:
         The merged world elements dictionary
     """
+    if new is existing or not new:
+        return existing
+    if not existing:
+        return dict(new)
+    
     result = existing.copy()
     
     for category, elements in new.items():
-        if category in result:
+        if category in result and not (elements.keys() & result[category].keys()):
+            # None of the keys exist yet, so there is nothing to merge item by item
+            result[category] = {**result[category], **elements}
+        elif category in result:
             # If category exists, update it intelligently
             result_category = result[category].copy()
             
@@ -334,10 +339,16 @@ def merge_world_elements(existing: WorldElementsDict, new: WorldElementsDict) ->
                     # Handle lists by appending
                     if isinstance(value, list) and isinstance(result_category[key], list):
                         # For lists, append new items to avoid duplicates
-                        existing_items = set(str(item) for item in result_category[key])
+                        existing_items = {_dedup_key(item) for item in result_category[key]}
+                        new_items = []
                         for item in value:
-                            if str(item) not in existing_items:
-                                result_category[key].append(item)
+                            item_key = _dedup_key(item)
+                            if item_key not in existing_items:
+                                existing_items.add(item_key)
+                                new_items.append(item)
+                        if new_items:
+                            # Build a new list rather than appending to the one shared with the existing state
+                            result_category[key] = result_category[key] + new_items
                     # Handle nested dictionaries recursively
                     elif isinstance(value, dict) and isinstance(result_category[key], dict):
                         result_category[key] = {**result_category[key], **value}
@@ -8,6 +8,7 @@ from storyteller_lib.config import llm, manage_memory_tool, search_memory_tool,
 from storyteller_lib.models import StoryState
 from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage
 from storyteller_lib.creative_tools import generate_structured_json, parse_json_with_langchain
+from storyteller_lib.initialization import invalidate_author_style_cache
 from storyteller_lib import track_progress
 
 @track_progress
@@ -53,6 +54,7 @@ def generate_story_outline(state: StoryState) -> Dict:
                 "value": author_style_guidance,
                 "namespace": MEMORY_NAMESPACE
             })
+            invalidate_author_style_cache()
         
         style_guidance = f"""
         AUTHOR STYLE GUIDANCE:
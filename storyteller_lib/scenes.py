@@ -9,7 +9,7 @@ from storyteller_lib.models import StoryState
 from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage
 from storyteller_lib.creative_tools import creative_brainstorm
 from storyteller_lib.plot_threads import get_active_plot_threads_for_scene
-from storyteller_lib.exposition import identify_telling_passages, convert_exposition_to_sensory, analyze_showing_vs_telling
+from storyteller_lib.exposition import identify_telling_passages, convert_exposition_to_sensory_batch, analyze_showing_vs_telling
 from storyteller_lib import track_progress
 
 def _prepare_author_style_guidance(author: str, author_style_guidance: str) -> str:
@@ -950,7 +950,7 @@ def write_scene(state: StoryState) -> Dict:
     if post_process_showing:
         try:
             # Import the necessary functions from exposition.py
-            from storyteller_lib.exposition import identify_telling_passages, convert_exposition_to_sensory
+            from storyteller_lib.exposition import identify_telling_passages, convert_exposition_to_sensory_batch
             
             # Identify telling passages
             telling_passages = identify_telling_passages(scene_content)
@@ -962,22 +962,22 @@ def write_scene(state: StoryState) -> Dict:
                 # Track original and converted passages for analysis
                 conversion_tracking = []
                 
+                # Convert all substantial passages to sensory descriptions in one batch
+                passages = [passage for passage in telling_passages if len(passage) > 20]
+                sensory_versions = convert_exposition_to_sensory_batch(passages)
+                
                 # Process each telling passage
-                for passage in telling_passages:
-                    if len(passage) > 20:  # Only process substantial passages
-                        # Convert to sensory description
-                        sensory_version = convert_exposition_to_sensory(passage)
+                for passage, sensory_version in zip(passages, sensory_versions):
+                    # Replace in the scene content if conversion was successful
+                    if sensory_version and sensory_version != passage:
+                        # Track the conversion
+                        conversion_tracking.append({
+                            "original": passage,
+                            "converted": sensory_version
+                        })
                         
-                        # Replace in the scene content if conversion was successful
-                        if sensory_version and sensory_version != passage:
-                            # Track the conversion
-                            conversion_tracking.append({
-                                "original": passage,
-                                "converted": sensory_version
-                            })
-                            
-                            # Replace in the scene content
-                            scene_content = scene_content.replace(passage, sensory_version)
+                        # Replace in the scene content
+                        scene_content = scene_content.replace(passage, sensory_version)
                 
                 # Store conversion tracking in memory for analysis
                 if conversion_tracking:
@@ -2127,24 +2127,26 @@ def process_showing_telling(state: StoryState) -> Dict:
         conversion_tracking = []
         improved_content = scene_content
         
-        for instance in telling_instances:
-            text = instance.get("text", "")
-            if text and len(text) > 20:  # Only process substantial passages
-                # Convert to sensory description
-                sensory_version = convert_exposition_to_sensory(text)
+        # Only process substantial passages, converting them in one batch
+        instances = [instance for instance in telling_instances
+                     if instance.get("text", "") and len(instance.get("text", "")) > 20]
+        sensory_versions = convert_exposition_to_sensory_batch([instance["text"] for instance in instances])
+        
+        for instance, sensory_version in zip(instances, sensory_versions):
+            text = instance["text"]
+            
+            # Replace in the scene content if conversion was successful
+            if sensory_version and sensory_version != text:
+                # Track the conversion
+                conversion_tracking.append({
+                    "original": text,
+                    "converted": sensory_version,
+                    "issue": instance.get("issue", ""),
+                    "improvement": instance.get("improvement_suggestion", "")
+                })
                 
-                # Replace in the scene content if conversion was successful
-                if sensory_version and sensory_version != text:
-                    # Track the conversion
-                    conversion_tracking.append({
-                        "original": text,
-                        "converted": sensory_version,
-                        "issue": instance.get("issue", ""),
-                        "improvement": instance.get("improvement_suggestion", "")
-                    })
-                    
-                    # Replace in the scene content
-                    improved_content = improved_content.replace(text, sensory_version)
+                # Replace in the scene content
+                improved_content = improved_content.replace(text, sensory_version)
         
         # Store conversion tracking in memory for analysis
         if conversion_tracking: